@@ -10,8 +10,12 @@ This script:
 5. Saves transformed data
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from faker import Faker
 
@@ -19,78 +23,147 @@ from faker import Faker
 src_path = Path(__file__).parent.parent / 'src'
 sys.path.insert(0, str(src_path))
 
-from privacy_aware_transform.metadata import SyntheticMetadataGenerator
-from privacy_aware_transform.classifier import SensitivityClassifier
+from privacy_aware_transform.metadata import SyntheticMetadataGenerator, TableMetadata
+from privacy_aware_transform.classifier import ClassificationResult, SensitivityClassifier
 from privacy_aware_transform.policy import PolicyEngine
 from privacy_aware_transform.transforms import TransformationEngine
 from privacy_aware_transform.utils import (
     save_csv_data,
-    apply_transformations_to_dataframe,
+    apply_transformations_multi_consumer,
     print_classification_report
 )
 
 
-def generate_sample_customer_data(n_rows: int = 5) -> pd.DataFrame:
-    """Generate synthetic customer data."""
-    fake = Faker()
-    Faker.seed(42)
-
-    data = {
-        'customer_id': list(range(1, n_rows + 1)),
-        'first_name': [fake.first_name() for _ in range(n_rows)],
-        'last_name': [fake.last_name() for _ in range(n_rows)],
-        'email': [fake.email() for _ in range(n_rows)],
-        'phone': [fake.phone_number() for _ in range(n_rows)],
-        'ssn': [fake.ssn() for _ in range(n_rows)],
-        'dob': [fake.date_of_birth().isoformat() for _ in range(n_rows)],
-        'address': [fake.street_address() for _ in range(n_rows)],
-        'city': [fake.city() for _ in range(n_rows)],
-        'state': [fake.state_abbr() for _ in range(n_rows)],
-        'zip_code': [fake.zipcode() for _ in range(n_rows)],
-        'registration_date': [fake.date_between(start_date='-3y').isoformat() for _ in range(n_rows)],
-        'status': [fake.random_element(['active', 'inactive']) for _ in range(n_rows)],
-    }
+# Declarative column specs: (column_name, (kind, *args)). Kinds:
+#   range               -> 1..n_rows
+#   faker, make         -> make(fake) per row (free-text values)
+#   choice, options     -> rng.choice(options)
+#   integers, lo, hi    -> rng.integers in [lo, hi]
+#   uniform, lo, hi     -> rng.uniform in [lo, hi), rounded to 2 decimals
+CUSTOMER_SCHEMA = [
+    ('customer_id', ('range',)),
+    ('first_name', ('faker', lambda fake: fake.first_name())),
+    ('last_name', ('faker', lambda fake: fake.last_name())),
+    ('email', ('faker', lambda fake: fake.email())),
+    ('phone', ('faker', lambda fake: fake.phone_number())),
+    ('ssn', ('faker', lambda fake: fake.ssn())),
+    ('dob', ('faker', lambda fake: fake.date_of_birth().isoformat())),
+    ('address', ('faker', lambda fake: fake.street_address())),
+    ('city', ('faker', lambda fake: fake.city())),
+    ('state', ('faker', lambda fake: fake.state_abbr())),
+    ('zip_code', ('faker', lambda fake: fake.zipcode())),
+    ('registration_date', ('faker', lambda fake: fake.date_between(start_date='-3y').isoformat())),
+    ('status', ('choice', ['active', 'inactive'])),
+]
+
+PATIENT_SCHEMA = [
+    ('patient_id', ('range',)),
+    ('patient_name', ('faker', lambda fake: fake.name())),
+    ('medical_record_number', ('faker', lambda fake: f"MRN{fake.random_int(100000, 999999)}")),
+    ('diagnosis', ('choice', ['Diabetes Type 2', 'Hypertension', 'Asthma', 'COVID-19'])),
+    ('medication', ('choice', ['Metformin', 'Lisinopril', 'Albuterol', 'Remdesivir'])),
+    ('dob', ('faker', lambda fake: fake.date_of_birth(minimum_age=30, maximum_age=80).isoformat())),
+    ('visit_date', ('faker', lambda fake: fake.date_between(start_date='-1m').isoformat())),
+    ('provider_name', ('choice', ['Dr. Smith', 'Dr. Johnson', 'Nurse Brown', 'Nurse Davis'])),
+    ('visit_count', ('integers', 1, 10)),
+]
+
+SALES_SCHEMA = [
+    ('transaction_id', ('range',)),
+    ('customer_id', ('integers', 100, 200)),
+    ('product_name', ('choice', ['Laptop', 'Mouse', 'Monitor', 'Keyboard', 'USB Cable'])),
+    ('quantity', ('integers', 1, 10)),
+    ('amount', ('uniform', 10, 5000)),
+    ('payment_method', ('choice', ['credit_card', 'debit_card', 'paypal'])),
+    ('transaction_date', ('faker', lambda fake: fake.date_between(start_date='-6m').isoformat())),
+    ('order_status', ('choice', ['completed', 'pending', 'shipped'])),
+]
+
+
+def build_df(schema: list, n_rows: int, fake: Faker, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Build a DataFrame from a declarative column schema.
+
+    Columns are produced in schema order; everything except Faker-backed
+    free-text columns is generated as a NumPy array in one call.
+    """
+    data = {}
+    for column_name, (kind, *args) in schema:
+        if kind == 'range':
+            data[column_name] = np.arange(1, n_rows + 1)
+        elif kind == 'faker':
+            make = args[0]
+            data[column_name] = [make(fake) for _ in range(n_rows)]
+        elif kind == 'choice':
+            data[column_name] = rng.choice(args[0], size=n_rows)
+        elif kind == 'integers':
+            low, high = args
+            data[column_name] = rng.integers(low, high + 1, size=n_rows)
+        elif kind == 'uniform':
+            low, high = args
+            data[column_name] = rng.uniform(low, high, size=n_rows).round(2)
+        else:
+            raise ValueError(f"Unknown column spec kind: {kind}")
 
     return pd.DataFrame(data)
 
 
-def generate_sample_patient_data(n_rows: int = 5) -> pd.DataFrame:
-    """Generate synthetic patient data."""
-    fake = Faker()
+def generate_sample_data(
+    schema: list, n_rows: int = 5, fake: Optional[Faker] = None
+) -> pd.DataFrame:
+
+    """Generate synthetic data for a schema with reproducible seeds."""
+    fake = fake or Faker()
     Faker.seed(42)
+    return build_df(schema, n_rows, fake, np.random.default_rng(42))
 
-    data = {
-        'patient_id': list(range(1, n_rows + 1)),
-        'patient_name': [fake.name() for _ in range(n_rows)],
-        'medical_record_number': [f"MRN{fake.random_int(100000, 999999)}" for _ in range(n_rows)],
-        'diagnosis': [fake.random_element(['Diabetes Type 2', 'Hypertension', 'Asthma', 'COVID-19']) for _ in range(n_rows)],
-        'medication': [fake.random_element(['Metformin', 'Lisinopril', 'Albuterol', 'Remdesivir']) for _ in range(n_rows)],
-        'dob': [fake.date_of_birth(minimum_age=30, maximum_age=80).isoformat() for _ in range(n_rows)],
-        'visit_date': [fake.date_between(start_date='-1m').isoformat() for _ in range(n_rows)],
-        'provider_name': [fake.random_element(['Dr. Smith', 'Dr. Johnson', 'Nurse Brown', 'Nurse Davis']) for _ in range(n_rows)],
-        'visit_count': [fake.random_int(1, 10) for _ in range(n_rows)],
-    }
 
-    return pd.DataFrame(data)
+def generate_sample_customer_data(n_rows: int = 5, fake: Optional[Faker] = None) -> pd.DataFrame:
+    """Generate synthetic customer data."""
+    return generate_sample_data(CUSTOMER_SCHEMA, n_rows, fake)
 
 
-def generate_sample_sales_data(n_rows: int = 5) -> pd.DataFrame:
+def generate_sample_patient_data(n_rows: int = 5, fake: Optional[Faker] = None) -> pd.DataFrame:
+    """Generate synthetic patient data."""
+    return generate_sample_data(PATIENT_SCHEMA, n_rows, fake)
+
+
+def generate_sample_sales_data(n_rows: int = 5, fake: Optional[Faker] = None) -> pd.DataFrame:
     """Generate synthetic sales transaction data."""
-    fake = Faker()
-    Faker.seed(42)
+    return generate_sample_data(SALES_SCHEMA, n_rows, fake)
+
+
+def transform_table_for_consumers(
+    table_name: str,
+    df: pd.DataFrame,
+    table_meta: TableMetadata,
+    classifications: Dict[str, ClassificationResult],
+    consumer_types: List[str],
+    data_dir: Path
+) -> List[Tuple[str, Path]]:
+    """
+    Transform one table for all consumers and write the output CSVs.
+
+    Runs in a worker process, so it builds its own policy and
+    transformation engines rather than sharing the parent's.
+
+    Returns:
+        List of (consumer_type, output_file) pairs
+    """
+    policy_engine = PolicyEngine()
+    transformation_engine = TransformationEngine()
 
-    data = {
-        'transaction_id': list(range(1, n_rows + 1)),
-        'customer_id': [fake.random_int(100, 200) for _ in range(n_rows)],
-        'product_name': [fake.random_element(['Laptop', 'Mouse', 'Monitor', 'Keyboard', 'USB Cable']) for _ in range(n_rows)],
-        'quantity': [fake.random_int(1, 10) for _ in range(n_rows)],
-        'amount': [round(fake.random.uniform(10, 5000), 2) for _ in range(n_rows)],
-        'payment_method': [fake.random_element(['credit_card', 'debit_card', 'paypal']) for _ in range(n_rows)],
-        'transaction_date': [fake.date_between(start_date='-6m').isoformat() for _ in range(n_rows)],
-        'order_status': [fake.random_element(['completed', 'pending', 'shipped']) for _ in range(n_rows)],
-    }
+    transformed = apply_transformations_multi_consumer(
+        df, table_meta, classifications,
+        consumer_types, transformation_engine, policy_engine
+    )
 
-    return pd.DataFrame(data)
+    written = []
+    for consumer_type, transformed_df in transformed.items():
+        output_file = data_dir / consumer_type / f"{table_name}_transformed.csv"
+        save_csv_data(transformed_df, str(output_file))
+        written.append((consumer_type, output_file))
+    return written
 
 
 def main():
@@ -111,23 +184,25 @@ def main():
         print(f"Generated: {filepath}")
 
     print("\nGenerating sample data files...")
+    # Faker() loads its providers on construction; build it once and share it
+    fake = Faker()
     data_dir = Path('data/synthetic')
     data_dir.mkdir(parents=True, exist_ok=True)
 
     # Customer data
-    customers_df = generate_sample_customer_data(n_rows=5)
+    customers_df = generate_sample_customer_data(n_rows=5, fake=fake)
     customers_file = data_dir / 'customers.csv'
     save_csv_data(customers_df, str(customers_file))
     print(f"Generated: {customers_file}")
 
     # Patient data
-    patients_df = generate_sample_patient_data(n_rows=5)
+    patients_df = generate_sample_patient_data(n_rows=5, fake=fake)
     patients_file = data_dir / 'patient_records.csv'
     save_csv_data(patients_df, str(patients_file))
     print(f" Generated: {patients_file}")
 
     # Sales data
-    sales_df = generate_sample_sales_data(n_rows=5)
+    sales_df = generate_sample_sales_data(n_rows=5, fake=fake)
     sales_file = data_dir / 'sales_transactions.csv'
     save_csv_data(sales_df, str(sales_file))
     print(f"Generated: {sales_file}")
@@ -158,25 +233,31 @@ def main():
 
     print("\nApplying privacy transformations for different consumers...")
 
-    policy_engine = PolicyEngine()
-    transformation_engine = TransformationEngine()
-
     consumer_types = ['internal_analyst', 'external_partner', 'reporting', 'public']
 
     for consumer_type in consumer_types:
-        print(f"\n  Transforming for consumer: {consumer_type}")
-        output_subdir = data_dir / consumer_type
-        output_subdir.mkdir(parents=True, exist_ok=True)
-
-        for table_name, (df, table_meta, classifications) in results.items():
-            transformed_df = apply_transformations_to_dataframe(
-                df, table_meta, classifications,
-                consumer_type, transformation_engine, policy_engine
+        (data_dir / consumer_type).mkdir(parents=True, exist_ok=True)
+
+    # Worker processes inherit the environment, so pin one tokenization key
+    # up front to keep tokens consistent across tables
+    os.environ.setdefault('PRIVACY_SECRET_KEY', os.urandom(32).hex())
+
+    # Tables are independent, so transform them in parallel; each job covers
+    # every consumer so shared column rules are only applied once
+    with ProcessPoolExecutor(max_workers=min(len(results), os.cpu_count() or 1)) as executor:
+        futures = {
+            table_name: executor.submit(
+                transform_table_for_consumers,
+                table_name, df, table_meta, classifications,
+                consumer_types, data_dir
             )
+            for table_name, (df, table_meta, classifications) in results.items()
+        }
 
-            output_file = output_subdir / f"{table_name}_transformed.csv"
-            save_csv_data(transformed_df, str(output_file))
-            print(f"    ✓ {table_name} -> {output_file}")
+        for table_name, future in futures.items():
+            print(f"\n  Transformed table: {table_name}")
+            for consumer_type, output_file in future.result():
+                print(f"    ✓ {consumer_type} -> {output_file}")
 
     print("\nDone!\n")
     print("Generated files:")
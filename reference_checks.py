@@ -0,0 +1,30 @@
+"""
+Shared helpers for tests that check an optimised code path against a
+straightforward reference implementation.
+"""
+
+import random
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+
+def random_metadata_texts(
+    words: Sequence[str], count: int = 2000, seed: int = 0
+) -> List[Tuple[str, str]]:
+    """
+    Draw reproducible (column name, description) pairs from a word list.
+
+    Names join two words with underscores, descriptions join three with spaces.
+    """
+    rng = random.Random(seed)
+    return [("_".join(rng.sample(words, 2)), " ".join(rng.sample(words, 3))) for _ in range(count)]
+
+
+def assert_matches_reference(fast: Callable, reference: Callable, cases: Iterable[Any]) -> None:
+    """Assert that fast(case) == reference(case) for every case."""
+    for case in cases:
+        assert fast(case) == reference(case), case
+
+
+def transform_each(transformer, values: Iterable[Any]) -> List[Any]:
+    """Reference for Transformer.transform_column: transform() on every value."""
+    return [transformer.transform(value) for value in values]
@@ -0,0 +1,9 @@
+"""
+Compatibility helpers for the range of supported Python versions.
+"""
+
+import sys
+
+# dataclass(slots=True) is only available on Python 3.10+; older versions
+# fall back to regular __dict__-backed instances
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
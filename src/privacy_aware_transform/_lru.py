@@ -0,0 +1,37 @@
+"""
+Bounded least-recently-used mapping for per-instance caches.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache(OrderedDict):
+    """
+    Dictionary holding at most maxsize entries.
+
+    Reads through get() or [] mark an entry as recently used; storing a new
+    key past maxsize evicts the least recently used entry.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def __reduce__(self):
+        return (type(self), (self.maxsize,), None, None, iter(self.items()))
@@ -7,23 +7,118 @@ and optional machine learning models trained on metadata.
 
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 import re
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import Pipeline
+from ._compat import DATACLASS_SLOTS
+from ._lru import LRUCache
 from .metadata import ColumnMetadata
+from .policy import parse_sensitivity_level
 
 
-@dataclass
+def _compile_pattern_union(
+    patterns: Dict[str, str]
+) -> Tuple["re.Pattern", Tuple[Tuple["re.Pattern", str], ...]]:
+    """
+    Merge a pattern -> reason mapping into a single alternation regex.
+
+    The union answers whether any pattern matches with one search. It
+    reports whichever alternative matches earliest in the text, so the
+    individually compiled patterns are kept, in priority order, to pick the
+    reason. Everything is case-insensitive, so callers do not need to
+    lowercase the text first.
+
+    Returns:
+        Tuple of (compiled union pattern, ((compiled pattern, reason), ...))
+    """
+    union = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in patterns),
+        re.IGNORECASE
+    )
+    ordered = tuple(
+        (re.compile(pattern, re.IGNORECASE), reason)
+        for pattern, reason in patterns.items()
+    )
+    return union, ordered
+
+
+
+# Rule-based patterns for each sensitivity class: regex -> reason
+PII_PATTERNS = {
+    r'(first_?name|last_?name|name|full_?name)': 'name patterns',
+    r'(email|email_?address|e_?mail)': 'email patterns',
+    r'(phone|tel|mobile|contact)': 'phone patterns',
+    r'(ssn|social_?security|social_security_?number)': 'SSN patterns',
+    r'(passport|driver_?license|drivers_?license)': 'ID document patterns',
+    r'(address|street|residence)': 'address patterns',
+    r'(dob|date_?of_?birth|birth_?date)': 'date of birth patterns',
+    r'(credit_?card|cc_?number|card_?number)': 'credit card patterns',
+    r'(account_?number|acct_?number)': 'account number patterns',
+}
+
+PHI_PATTERNS = {
+    r'(diagnosis|diagnoses|medical_?condition)': 'diagnosis patterns',
+    r'(medication|medicine|drug|prescription)': 'medication patterns',
+    r'(medical_?record|patient_?record|health_?record)': 'medical record patterns',
+    r'(patient|health|medical|clinical)': 'health domain keywords',
+    r'(laboratory|lab_?result|lab_?test)': 'lab result patterns',
+    r'(procedure|surgery|treatment)': 'treatment patterns',
+}
+
+SENSITIVE_PATTERNS = {
+    r'(salary|income|wage|payment|amount|price|cost|revenue)': 'financial amount patterns',
+    r'(bank|account|balance|transaction|financial)': 'financial keywords',
+    r'(zip_?code|postal_?code|location|latitude|longitude)': 'location patterns',
+    r'(ip_?address|device_?id|mac_?address|imei)': 'device identifier patterns',
+    r'(password|secret|token|key|credential)': 'security credential patterns',
+    r'(religion|ethnicity|race|gender|sexual_?orientation)': 'demographic sensitive patterns',
+}
+
+# One precompiled alternation per class, built once at import and shared by
+# every SensitivityClassifier: a single search per class that does not match
+# instead of one re.search call per pattern
+_PII_RE, _PII_REASONS = _compile_pattern_union(PII_PATTERNS)
+_PHI_RE, _PHI_REASONS = _compile_pattern_union(PHI_PATTERNS)
+_SENSITIVE_RE, _SENSITIVE_REASONS = _compile_pattern_union(SENSITIVE_PATTERNS)
+
+# Rule passes in priority order: (union, ordered patterns, class, confidence, label)
+_RULE_PASSES = (
+    (_PII_RE, _PII_REASONS, 'PII', 0.9, 'PII'),
+    (_PHI_RE, _PHI_REASONS, 'PHI', 0.9, 'PHI'),
+    (_SENSITIVE_RE, _SENSITIVE_REASONS, 'Sensitive', 0.85, 'sensitive'),
+)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ClassificationResult:
-    """Result of column sensitivity classification."""
+    """Result of column sensitivity classification (immutable)."""
     column_name: str
     sensitivity_class: str  # PII, PHI, Sensitive, Non-Sensitive
     confidence: float
     reasoning: str
-    method: str = "rule-based"  # or "ml" or "blended"
+    method: str = "rule-based"  # or "ml", "blended" or "metadata"
+
+
+@lru_cache(maxsize=4096)
+def _rule_lookup(combined_text: str) -> Tuple[str, float, str]:
+    """
+    Run the rule passes over a "name description" string.
+
+    Cached at module level so columns repeated across tables (customer_id,
+    dob, ...) are only matched once per process.
+
+    Returns:
+        Tuple of (sensitivity_class, confidence, reasoning)
+    """
+    for union, reasons, sensitivity_class, confidence, label in _RULE_PASSES:
+        if union.search(combined_text):
+            # Report the first pattern in priority order, not the earliest match
+            reason = next(reason for regex, reason in reasons if regex.search(combined_text))
+            return sensitivity_class, confidence, f"Matched {label} pattern: {reason}"
+
+    # Default to Non-Sensitive
+    return 'Non-Sensitive', 0.7, "No sensitivity patterns matched; column is non-sensitive"
 
 
 class SensitivityClassifier:
@@ -38,49 +133,39 @@ class SensitivityClassifier:
     - Non-Sensitive: Public or low-sensitivity data
     """
 
-    # Rule-based patterns for each sensitivity class
-    PII_PATTERNS = {
-        r'(first_?name|last_?name|name|full_?name)': 'name patterns',
-        r'(email|email_?address|e_?mail)': 'email patterns',
-        r'(phone|tel|mobile|contact)': 'phone patterns',
-        r'(ssn|social_?security|social_security_?number)': 'SSN patterns',
-        r'(passport|driver_?license|drivers_?license)': 'ID document patterns',
-        r'(address|street|residence)': 'address patterns',
-        r'(dob|date_?of_?birth|birth_?date)': 'date of birth patterns',
-        r'(credit_?card|cc_?number|card_?number)': 'credit card patterns',
-        r'(account_?number|acct_?number)': 'account number patterns',
-    }
-
-    PHI_PATTERNS = {
-        r'(diagnosis|diagnoses|medical_?condition)': 'diagnosis patterns',
-        r'(medication|medicine|drug|prescription)': 'medication patterns',
-        r'(medical_?record|patient_?record|health_?record)': 'medical record patterns',
-        r'(patient|health|medical|clinical)': 'health domain keywords',
-        r'(laboratory|lab_?result|lab_?test)': 'lab result patterns',
-        r'(procedure|surgery|treatment)': 'treatment patterns',
-    }
-
-    SENSITIVE_PATTERNS = {
-        r'(salary|income|wage|payment|amount|price|cost|revenue)': 'financial amount patterns',
-        r'(bank|account|balance|transaction|financial)': 'financial keywords',
-        r'(zip_?code|postal_?code|location|latitude|longitude)': 'location patterns',
-        r'(ip_?address|device_?id|mac_?address|imei)': 'device identifier patterns',
-        r'(password|secret|token|key|credential)': 'security credential patterns',
-        r'(religion|ethnicity|race|gender|sexual_?orientation)': 'demographic sensitive patterns',
-    }
-
-    def __init__(self, use_ml: bool = False, ml_model_path: Optional[str] = None):
+    # Rule-based patterns for each sensitivity class (compiled at module level)
+    PII_PATTERNS = PII_PATTERNS
+    PHI_PATTERNS = PHI_PATTERNS
+    SENSITIVE_PATTERNS = SENSITIVE_PATTERNS
+
+    ML_CACHE_MAXSIZE = 2048
+
+    def __init__(
+        self,
+        use_ml: bool = False,
+        ml_model_path: Optional[str] = None,
+        trust_metadata: bool = True
+    ):
         """
         Initialize the classifier.
 
         Args:
             use_ml: Whether to use ML model
-            ml_model_path: Path to pre-trained ML model (pickle file).
+            ml_model_path: Path to pre-trained ML model (joblib or pickle file).
                           If not provided and use_ml=True, looks for models/sensitivity_classifier.pkl
+            trust_metadata: Whether a sensitivity declared in column metadata is
+                           used as-is, skipping rules and ML for that column
         """
         self.use_ml = use_ml
+        self.trust_metadata = trust_metadata
         self.ml_pipeline = None
         self.ml_classes = ['PII', 'PHI', 'Sensitive', 'Non-Sensitive']
+        # ML predictions keyed by combined feature text: (class, confidence),
+        # for the ML_CACHE_MAXSIZE most recently used texts
+        self._ml_cache: Dict[str, Tuple[str, float]] = LRUCache(self.ML_CACHE_MAXSIZE)
+        # Fast predictor specialised for ml_pipeline (see _get_predictor)
+        self._predictor = None
+        self._predictor_source = None
 
         if use_ml:
             # Try to load pre-trained model
@@ -97,11 +182,13 @@ class SensitivityClassifier:
                 self.use_ml = False
 
     def _load_ml_model(self, model_path: str) -> None:
-        """Load pre-trained ML model from pickle file."""
-        import pickle
+        """Load pre-trained ML model from a joblib or pickle file."""
         try:
-            with open(model_path, 'rb') as f:
-                self.ml_pipeline = pickle.load(f)
+            from .ml_classifier import MLClassifierTrainer
+            # Only used for prediction, so the arrays can be shared read-only
+            self.ml_pipeline = MLClassifierTrainer.load_model(model_path, mmap_mode='r')
+            self._ml_cache.clear()
+            self._predictor_source = None
             print(f"✓ Loaded ML model from {model_path}")
         except Exception as e:
             print(f"Warning: Could not load ML model from {model_path}: {e}")
@@ -113,6 +200,8 @@ class SensitivityClassifier:
         
         Uses rule-based classification first. If confidence < 0.8 and ML model available,
         blends ML prediction with rule-based result using weighted averaging.
+        A sensitivity declared in the metadata short-circuits both when
+        trust_metadata is enabled.
 
         Args:
             column: ColumnMetadata object
@@ -120,16 +209,51 @@ class SensitivityClassifier:
         Returns:
             ClassificationResult with sensitivity class and confidence
         """
-        # First try rule-based classification
+        declared = self._classify_by_metadata(column)
+        if declared is not None:
+            return declared
+
         rule_result = self._classify_by_rules(column)
+        ml_result = self._classify_by_ml(column) if self._needs_ml(rule_result) else None
+        return self._blend_results(column, rule_result, ml_result)
+
+    def _classify_by_metadata(self, column: ColumnMetadata) -> Optional[ClassificationResult]:
+        """Return a result for a column whose metadata declares its sensitivity, if trusted."""
+        if not self.trust_metadata or column.sensitivity is None:
+            return None
+
+        # Same spellings as the policy engine accepts (pii, Non_Sensitive, ...);
+        # an unrecognised value is classified from the rest of the metadata
+        level = parse_sensitivity_level(column.sensitivity)
+        if level is None:
+            print(
+                f"Warning: Ignoring invalid declared sensitivity for column {column.name}: "
+                f"{column.sensitivity!r} (expected one of {', '.join(self.ml_classes)})"
+            )
+            return None
 
-        # If using ML model and rules are uncertain, blend with ML
-        if self.use_ml and self.ml_pipeline and rule_result.confidence < 0.8:
-            ml_result = self._classify_by_ml(column)
-            
-            # If ML has higher confidence, prefer it
+        return ClassificationResult(
+            column_name=column.name,
+            sensitivity_class=level.value,
+            confidence=1.0,
+            reasoning="Sensitivity declared in metadata",
+            method="metadata"
+        )
+
+    def _needs_ml(self, rule_result: ClassificationResult) -> bool:
+        """Whether the ML model should be consulted for a rule-based result."""
+        return bool(self.use_ml and self.ml_pipeline and rule_result.confidence < 0.8)
+
+    def _blend_results(
+        self,
+        column: ColumnMetadata,
+        rule_result: ClassificationResult,
+        ml_result: Optional[ClassificationResult]
+    ) -> ClassificationResult:
+        """Blend a rule-based result with an ML result, if one was computed."""
+        if ml_result is not None:
+            # If ML has higher confidence, prefer it (already tagged "ml")
             if ml_result.confidence > rule_result.confidence:
-                ml_result.method = "ml"
                 return ml_result
             
             # Otherwise blend both methods
@@ -144,50 +268,56 @@ class SensitivityClassifier:
                     method="blended"
                 )
 
-        rule_result.method = "rule-based"
+        # Rule results are created with method="rule-based"
         return rule_result
 
     def _classify_by_rules(self, column: ColumnMetadata) -> ClassificationResult:
         """Classify using rule-based patterns."""
-        combined_text = f"{column.name} {column.description}".lower()
+        return self._classify_by_rules_batch([column])[0]
 
-        # Check PII patterns
-        for pattern, reason in self.PII_PATTERNS.items():
-            if re.search(pattern, combined_text):
-                return ClassificationResult(
-                    column_name=column.name,
-                    sensitivity_class='PII',
-                    confidence=0.9,
-                    reasoning=f"Matched PII pattern: {reason}"
-                )
+    def _classify_by_rules_batch(self, columns: List[ColumnMetadata]) -> List[ClassificationResult]:
+        """
+        Classify many columns using rule-based patterns.
 
-        # Check PHI patterns
-        for pattern, reason in self.PHI_PATTERNS.items():
-            if re.search(pattern, combined_text):
-                return ClassificationResult(
-                    column_name=column.name,
-                    sensitivity_class='PHI',
-                    confidence=0.9,
-                    reasoning=f"Matched PHI pattern: {reason}"
-                )
+        Rule matches are cached per combined text, so repeated columns
+        within or across tables skip the regex passes entirely.
 
-        # Check Sensitive patterns
-        for pattern, reason in self.SENSITIVE_PATTERNS.items():
-            if re.search(pattern, combined_text):
-                return ClassificationResult(
-                    column_name=column.name,
-                    sensitivity_class='Sensitive',
-                    confidence=0.85,
-                    reasoning=f"Matched sensitive pattern: {reason}"
-                )
+        Args:
+            columns: List of ColumnMetadata objects
 
-        # Default to Non-Sensitive
-        return ClassificationResult(
-            column_name=column.name,
-            sensitivity_class='Non-Sensitive',
-            confidence=0.7,
-            reasoning="No sensitivity patterns matched; column is non-sensitive"
-        )
+        Returns:
+            List of ClassificationResult in the same order as ``columns``
+        """
+        results = []
+        for column in columns:
+            sensitivity_class, confidence, reasoning = _rule_lookup(
+                f"{column.name} {column.description}"
+            )
+            results.append(ClassificationResult(
+                column_name=column.name,
+                sensitivity_class=sensitivity_class,
+                confidence=confidence,
+                reasoning=reasoning
+            ))
+        return results
+
+    def _get_predictor(self):
+        """
+        Return the predictor used for ML classification.
+
+        Prefers a FastLinearPredictor specialised for the current pipeline,
+        falling back to the pipeline itself when it cannot be specialised.
+        Rebuilt whenever ml_pipeline is replaced.
+        """
+        if self._predictor_source is not self.ml_pipeline:
+            from .ml_classifier import FastLinearPredictor
+            try:
+                self._predictor = FastLinearPredictor(self.ml_pipeline)
+            except (ValueError, AttributeError, TypeError):
+                self._predictor = self.ml_pipeline
+            self._predictor_source = self.ml_pipeline
+            self._ml_cache.clear()
+        return self._predictor
 
     def _classify_by_ml(self, column: ColumnMetadata) -> ClassificationResult:
         """
@@ -201,39 +331,91 @@ class SensitivityClassifier:
         Returns:
             ClassificationResult with ML prediction
         """
+        return self._classify_by_ml_batch([column])[0]
+
+    def _classify_by_ml_batch(self, columns: List[ColumnMetadata]) -> List[ClassificationResult]:
+        """
+        Classify many columns with a single ML model call.
+
+        Feature texts that are not cached yet are sent through the pipeline
+        together, so sklearn's per-call overhead is paid once per batch
+        rather than once per column.
+
+        Args:
+            columns: List of ColumnMetadata objects
+
+        Returns:
+            List of ClassificationResult in the same order as ``columns``
+        """
         if not self.ml_pipeline:
-            return ClassificationResult(
-                column_name=column.name,
-                sensitivity_class='Non-Sensitive',
-                confidence=0.0,
-                reasoning="ML model not available",
-                method="ml"
-            )
+            return [
+                ClassificationResult(
+                    column_name=column.name,
+                    sensitivity_class='Non-Sensitive',
+                    confidence=0.0,
+                    reasoning="ML model not available",
+                    method="ml"
+                )
+                for column in columns
+            ]
 
-        # Combine metadata as features
-        combined_text = f"{column.name} {column.description} {column.data_type}".lower()
-        
-        try:
-            prediction = self.ml_pipeline.predict([combined_text])[0]
-            probabilities = self.ml_pipeline.predict_proba([combined_text])[0]
-            confidence = float(max(probabilities))
+        import numpy as np
 
-            return ClassificationResult(
+        # Combine metadata as features
+        texts = [
+            f"{column.name} {column.description} {column.data_type}".lower()
+            for column in columns
+        ]
+
+
+        predictor = self._get_predictor()
+        # Predictions for this batch; kept apart from the bounded cache so a
+        # batch larger than the cache does not evict its own results
+        predicted: Dict[str, Tuple[str, float]] = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            cached = self._ml_cache.get(text)
+            if cached is None:
+                pending.append(text)
+            else:
+                predicted[text] = cached
+        if pending:
+            try:
+                # predict() would rerun the whole pipeline; recover the label
+                # from the argmax of the probabilities instead
+                probabilities = predictor.predict_proba(pending)
+            except Exception as e:
+                failed = [column.name for column, text in zip(columns, texts) if text in pending]
+                print(f"Warning: ML prediction failed for {', '.join(failed)}: {e}")
+            else:
+                best = np.argmax(probabilities, axis=1)
+                predictions = predictor.classes_[best]
+                confidences = probabilities[np.arange(len(best)), best]
+                for text, prediction, confidence in zip(pending, predictions, confidences):
+                    predicted[text] = self._ml_cache[text] = (prediction, float(confidence))
+
+        results = []
+        for column, text in zip(columns, texts):
+            cached = predicted.get(text)
+            if cached is None:
+                results.append(ClassificationResult(
+                    column_name=column.name,
+                    sensitivity_class='Non-Sensitive',
+                    confidence=0.0,
+                    reasoning="ML prediction error",
+                    method="ml"
+                ))
+                continue
+
+            prediction, confidence = cached
+            results.append(ClassificationResult(
                 column_name=column.name,
                 sensitivity_class=prediction,
                 confidence=confidence,
                 reasoning=f"ML model prediction (confidence {confidence:.2f})",
                 method="ml"
-            )
-        except Exception as e:
-            print(f"Warning: ML prediction failed for {column.name}: {e}")
-            return ClassificationResult(
-                column_name=column.name,
-                sensitivity_class='Non-Sensitive',
-                confidence=0.0,
-                reasoning="ML prediction error",
-                method="ml"
-            )
+            ))
+        return results
 
     def classify_table(self, table_columns: List[ColumnMetadata]) -> Dict[str, ClassificationResult]:
         """
@@ -245,10 +427,27 @@ class SensitivityClassifier:
         Returns:
             Dictionary mapping column names to ClassificationResult
         """
+        # Columns with a trusted declared sensitivity skip rules and ML
+        declared = [self._classify_by_metadata(column) for column in table_columns]
+        pending = [column for column, result in zip(table_columns, declared) if result is None]
+
+        rule_results = self._classify_by_rules_batch(pending)
+
+        # Send every uncertain column through the ML model in one batch
+        uncertain = [i for i, rule_result in enumerate(rule_results) if self._needs_ml(rule_result)]
+        ml_results = dict(zip(
+            uncertain,
+            self._classify_by_ml_batch([pending[i] for i in uncertain])
+        ))
+
+        classified = iter([
+            self._blend_results(column, rule_result, ml_results.get(i))
+            for i, (column, rule_result) in enumerate(zip(pending, rule_results))
+        ])
+
         results = {}
-        for column in table_columns:
-            result = self.classify_column(column)
-            results[column.name] = result
+        for column, result in zip(table_columns, declared):
+            results[column.name] = result if result is not None else next(classified)
         return results
 
     def train_ml_model(self, training_data: List[Tuple[str, str]]) -> None:
@@ -263,15 +462,31 @@ class SensitivityClassifier:
             print("Warning: No training data provided")
             return
 
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import Pipeline
+
         texts = [text for text, _ in training_data]
         labels = [label for _, label in training_data]
 
+        # liblinear is the faster solver for small sparse problems, but recent
+        # scikit-learn releases only accept it for binary targets
+        solver = 'liblinear' if len(set(labels)) <= 2 else 'lbfgs'
+
         self.ml_pipeline = Pipeline([
-            ('tfidf', TfidfVectorizer(max_features=100, lowercase=True)),
-            ('classifier', LogisticRegression(max_iter=200, random_state=42))
+            ('tfidf', TfidfVectorizer(
+                max_features=100,
+                lowercase=True,
+                dtype=np.float32,
+                sublinear_tf=True
+            )),
+            ('classifier', LogisticRegression(max_iter=200, random_state=42, solver=solver))
         ])
 
         self.ml_pipeline.fit(texts, labels)
+        self._ml_cache.clear()
+        self._predictor_source = None
         self.use_ml = True
         print(f"ML model trained on {len(training_data)} samples")
 
@@ -286,6 +501,5 @@ class SensitivityClassifier:
             Dictionary with counts per sensitivity class
         """
         summary = {'PII': 0, 'PHI': 0, 'Sensitive': 0, 'Non-Sensitive': 0}
-        for result in results.values():
-            summary[result.sensitivity_class] += 1
+        summary.update(Counter(result.sensitivity_class for result in results.values()))
         return summary
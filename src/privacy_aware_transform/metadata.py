@@ -8,16 +8,25 @@ Provides synthetic metadata generation for testing and experimentation.
 import os
 import json
 import yaml
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from faker import Faker
+from ._compat import DATACLASS_SLOTS
 
-# Set seed for reproducibility
-Faker.seed(42)
+# Prefer the libyaml-backed C loader/dumper; fall back to the pure-Python ones
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ColumnMetadata:
     """Represents metadata for a single column."""
     name: str
@@ -25,14 +34,27 @@ class ColumnMetadata:
     description: str = ""
     nullable: bool = True
     is_key: bool = False
-    examples: Optional[List[str]] = None
+    examples: Optional[Tuple[str, ...]] = None
+    sensitivity: Optional[str] = None  # Declared class (PII, PHI, Sensitive, Non-Sensitive)
+
+    def __post_init__(self):
+        if isinstance(self.examples, list):
+            self.examples = tuple(self.examples)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "name": self.name,
+            "data_type": self.data_type,
+            "description": self.description,
+            "nullable": self.nullable,
+            "is_key": self.is_key,
+            "examples": list(self.examples) if self.examples is not None else None,
+            "sensitivity": self.sensitivity
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TableMetadata:
     """Represents metadata for a table."""
     table_name: str
@@ -56,6 +78,50 @@ class TableMetadata:
         }
 
 
+@lru_cache(maxsize=2048)
+def _parse_table_yaml(path: str, mtime_ns: int, size: int) -> Tuple[tuple, Tuple[tuple, ...]]:
+    """
+    Parse a table metadata YAML file into an immutable representation.
+
+    The cache key includes the file's modification time and size, so an
+    edited file is re-parsed while unchanged files are served from cache.
+
+    Args:
+        path: Path to the YAML file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Tuple of ((table_name, database, description, owner), column tuples)
+        where each column tuple follows the ColumnMetadata field order
+    """
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    # Parse columns
+    columns = []
+    if 'columns' in data:
+        for col_data in data['columns']:
+            examples = col_data.get('examples', None)
+            columns.append((
+                col_data['name'],
+                col_data.get('data_type', 'string'),
+                col_data.get('description', ''),
+                col_data.get('nullable', True),
+                col_data.get('is_key', False),
+                tuple(examples) if isinstance(examples, list) else examples,
+                col_data.get('sensitivity', None)
+            ))
+
+    table_fields = (
+        data.get('table_name', ''),
+        data.get('database', 'default'),
+        data.get('description', ''),
+        data.get('owner', '')
+    )
+    return table_fields, tuple(columns)
+
+
 class MetadataLoader:
     """Loads table metadata from YAML files."""
 
@@ -84,34 +150,43 @@ class MetadataLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"Metadata file not found: {file_path}")
 
-        with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
+        stat = file_path.stat()
+        table_fields, column_fields = _parse_table_yaml(
+            str(file_path), stat.st_mtime_ns, stat.st_size
+        )
+
 
-        # Parse columns
+        # Build fresh (mutable) metadata objects from the cached tuples
         columns = []
-        if 'columns' in data:
-            for col_data in data['columns']:
-                col = ColumnMetadata(
-                    name=col_data['name'],
-                    data_type=col_data.get('data_type', 'string'),
-                    description=col_data.get('description', ''),
-                    nullable=col_data.get('nullable', True),
-                    is_key=col_data.get('is_key', False),
-                    examples=col_data.get('examples', None)
-                )
-                columns.append(col)
+        for name, data_type, description, nullable, is_key, examples, sensitivity in column_fields:
+            col = ColumnMetadata(
+                name=name,
+                data_type=data_type,
+                description=description,
+                nullable=nullable,
+                is_key=is_key,
+                examples=examples,
+                sensitivity=sensitivity
+            )
+            columns.append(col)
 
         # Create table metadata
+        table_name, database, description, owner = table_fields
         table_meta = TableMetadata(
-            table_name=data.get('table_name', ''),
-            database=data.get('database', 'default'),
-            description=data.get('description', ''),
-            owner=data.get('owner', ''),
+            table_name=table_name,
+            database=database,
+            description=description,
+            owner=owner,
             columns=columns
         )
 
         return table_meta
 
+    @staticmethod
+    def parse_cache_info():
+        """Return hit/miss statistics for the shared YAML parse cache."""
+        return _parse_table_yaml.cache_info()
+
     def load_all_tables(self) -> Dict[str, TableMetadata]:
         """
         Load metadata for all YAML files in the directory.
@@ -120,12 +195,19 @@ class MetadataLoader:
             Dictionary mapping table names to TableMetadata objects
         """
         tables = {}
-        for yaml_file in self.metadata_dir.glob('*.yaml'):
-            try:
-                table_meta = self.load_table_metadata(yaml_file.name)
-                tables[table_meta.table_name] = table_meta
-            except Exception as e:
-                print(f"Error loading {yaml_file.name}: {e}")
+        # scandir yields plain names with cached file types, avoiding a Path
+        # object and a stat() call per directory entry. Each file is parsed on
+        # its own: a joined multi-document stream is no faster and cannot
+        # reliably attribute documents to files (e.g. empty files).
+        with os.scandir(self.metadata_dir) as entries:
+            for entry in entries:
+                if not (entry.name.endswith('.yaml') and entry.is_file()):
+                    continue
+                try:
+                    table_meta = self.load_table_metadata(entry.name)
+                    tables[table_meta.table_name] = table_meta
+                except Exception as e:
+                    print(f"Error loading {entry.name}: {e}")
         return tables
 
 
@@ -139,6 +221,10 @@ class SyntheticMetadataGenerator:
         Args:
             seed: Random seed for reproducibility
         """
+        # Imported here so that loading metadata does not pay for Faker's
+        # provider registration
+        from faker import Faker
+
         self.fake = Faker()
         Faker.seed(seed)
 
@@ -150,79 +236,79 @@ class SyntheticMetadataGenerator:
                 data_type="int",
                 description="Unique customer identifier (primary key)",
                 is_key=True,
-                examples=["1", "2", "3"]
+                examples=("1", "2", "3")
             ),
             ColumnMetadata(
                 name="first_name",
                 data_type="string",
                 description="Customer first name (PII)",
-                examples=["John", "Jane", "Bob"]
+                examples=("John", "Jane", "Bob")
             ),
             ColumnMetadata(
                 name="last_name",
                 data_type="string",
                 description="Customer last name (PII)",
-                examples=["Doe", "Smith", "Johnson"]
+                examples=("Doe", "Smith", "Johnson")
             ),
             ColumnMetadata(
                 name="email",
                 data_type="string",
                 description="Customer email address (PII)",
-                examples=["john@example.com", "jane@example.com"]
+                examples=("john@example.com", "jane@example.com")
             ),
             ColumnMetadata(
                 name="phone",
                 data_type="string",
                 description="Customer phone number (PII)",
-                examples=["555-0101", "555-0102"]
+                examples=("555-0101", "555-0102")
             ),
             ColumnMetadata(
                 name="ssn",
                 data_type="string",
                 description="Social Security Number (Sensitive PII)",
-                examples=["123-45-6789", "987-65-4321"]
+                examples=("123-45-6789", "987-65-4321")
             ),
             ColumnMetadata(
                 name="dob",
                 data_type="date",
                 description="Date of birth (PII)",
-                examples=["1990-01-15", "1985-06-20"]
+                examples=("1990-01-15", "1985-06-20")
             ),
             ColumnMetadata(
                 name="address",
                 data_type="string",
                 description="Customer street address (PII)",
-                examples=["123 Main St", "456 Oak Ave"]
+                examples=("123 Main St", "456 Oak Ave")
             ),
             ColumnMetadata(
                 name="city",
                 data_type="string",
                 description="Customer city (Sensitive)",
-                examples=["New York", "Los Angeles"]
+                examples=("New York", "Los Angeles")
             ),
             ColumnMetadata(
                 name="state",
                 data_type="string",
                 description="Customer state",
-                examples=["NY", "CA"]
+                examples=("NY", "CA")
             ),
             ColumnMetadata(
                 name="zip_code",
                 data_type="string",
                 description="Customer zip code (Sensitive)",
-                examples=["10001", "90001"]
+                examples=("10001", "90001")
             ),
             ColumnMetadata(
                 name="registration_date",
                 data_type="date",
                 description="Account registration date (Non-Sensitive)",
-                examples=["2020-01-01", "2021-06-15"]
+                examples=("2020-01-01", "2021-06-15")
             ),
             ColumnMetadata(
                 name="status",
                 data_type="string",
                 description="Customer account status (Non-Sensitive)",
-                examples=["active", "inactive"]
+                examples=("active", "inactive")
             ),
         ]
 
@@ -242,49 +328,49 @@ class SyntheticMetadataGenerator:
                 data_type="int",
                 description="Unique patient identifier (primary key)",
                 is_key=True,
-                examples=["1", "2", "3"]
+                examples=("1", "2", "3")
             ),
             ColumnMetadata(
                 name="patient_name",
                 data_type="string",
                 description="Patient full name (PHI)",
-                examples=["John Doe", "Jane Smith"]
+                examples=("John Doe", "Jane Smith")
             ),
             ColumnMetadata(
                 name="medical_record_number",
                 data_type="string",
                 description="Medical record number (PHI)",
-                examples=["MRN123456", "MRN789012"]
+                examples=("MRN123456", "MRN789012")
             ),
             ColumnMetadata(
                 name="diagnosis",
                 data_type="string",
                 description="Patient diagnosis (PHI/Sensitive)",
-                examples=["Diabetes Type 2", "Hypertension"]
+                examples=("Diabetes Type 2", "Hypertension")
             ),
             ColumnMetadata(
                 name="medication",
                 data_type="string",
                 description="Prescribed medication (PHI)",
-                examples=["Metformin", "Lisinopril"]
+                examples=("Metformin", "Lisinopril")
             ),
             ColumnMetadata(
                 name="dob",
                 data_type="date",
                 description="Date of birth (PHI)",
-                examples=["1965-03-20", "1970-11-10"]
+                examples=("1965-03-20", "1970-11-10")
             ),
             ColumnMetadata(
                 name="visit_date",
                 data_type="date",
                 description="Last visit date (Non-Sensitive)",
-                examples=["2024-12-15", "2024-11-20"]
+                examples=("2024-12-15", "2024-11-20")
             ),
             ColumnMetadata(
                 name="provider_name",
                 data_type="string",
                 description="Healthcare provider name (Non-Sensitive)",
-                examples=["Dr. Smith", "Nurse Johnson"]
+                examples=("Dr. Smith", "Nurse Johnson")
             ),
         ]
 
@@ -304,43 +390,43 @@ class SyntheticMetadataGenerator:
                 data_type="int",
                 description="Unique transaction identifier (primary key)",
                 is_key=True,
-                examples=["1", "2", "3"]
+                examples=("1", "2", "3")
             ),
             ColumnMetadata(
                 name="customer_id",
                 data_type="int",
                 description="Customer identifier (foreign key)",
-                examples=["101", "102", "103"]
+                examples=("101", "102", "103")
             ),
             ColumnMetadata(
                 name="product_name",
                 data_type="string",
                 description="Product name (Non-Sensitive)",
-                examples=["Laptop", "Mouse", "Monitor"]
+                examples=("Laptop", "Mouse", "Monitor")
             ),
             ColumnMetadata(
                 name="quantity",
                 data_type="int",
                 description="Purchase quantity (Non-Sensitive)",
-                examples=["1", "2", "5"]
+                examples=("1", "2", "5")
             ),
             ColumnMetadata(
                 name="amount",
                 data_type="float",
                 description="Transaction amount (Sensitive)",
-                examples=["1299.99", "2500.00"]
+                examples=("1299.99", "2500.00")
             ),
             ColumnMetadata(
                 name="payment_method",
                 data_type="string",
                 description="Payment method (Sensitive)",
-                examples=["credit_card", "debit_card"]
+                examples=("credit_card", "debit_card")
             ),
             ColumnMetadata(
                 name="transaction_date",
                 data_type="date",
                 description="Transaction date (Non-Sensitive)",
-                examples=["2024-12-01", "2024-12-15"]
+                examples=("2024-12-01", "2024-12-15")
             ),
         ]
 
@@ -366,25 +452,62 @@ class SyntheticMetadataGenerator:
         output_path = Path(output_dir) / f"{table_meta.table_name}.yaml"
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        yaml_data = {
+        with open(output_path, 'w') as f:
+            yaml.dump(self._metadata_document(table_meta), f, Dumper=_YamlDumper,
+                      default_flow_style=False, sort_keys=False)
+
+        return str(output_path)
+
+    def save_metadata_json(self, table_meta: TableMetadata, output_dir: str) -> str:
+        """
+        Save table metadata to a JSON file.
+
+        Uses orjson when it is installed, falling back to the standard
+        library json module. Both produce the same document as
+        save_metadata_yaml, indented by two spaces.
+
+        Args:
+            table_meta: TableMetadata object to save
+            output_dir: Directory to save the JSON file
+
+        Returns:
+            Path to saved JSON file
+        """
+        output_path = Path(output_dir) / f"{table_meta.table_name}.json"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = self._metadata_document(table_meta)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+        return str(output_path)
+
+    @staticmethod
+    def _metadata_document(table_meta: TableMetadata) -> Dict[str, Any]:
+        """Build the serialisable metadata document for a table."""
+        columns = []
+        for col in table_meta.columns:
+            col_data = {
+                "name": col.name,
+                "data_type": col.data_type,
+                "description": col.description,
+                "nullable": col.nullable,
+                "is_key": col.is_key,
+                "examples": list(col.examples) if isinstance(col.examples, tuple) else col.examples
+            }
+            # Only emit a declared sensitivity when one is set
+            if col.sensitivity is not None:
+                col_data["sensitivity"] = col.sensitivity
+            columns.append(col_data)
+
+        return {
             "table_name": table_meta.table_name,
             "database": table_meta.database,
             "description": table_meta.description,
             "owner": table_meta.owner,
-            "columns": [
-                {
-                    "name": col.name,
-                    "data_type": col.data_type,
-                    "description": col.description,
-                    "nullable": col.nullable,
-                    "is_key": col.is_key,
-                    "examples": col.examples
-                }
-                for col in table_meta.columns
-            ]
+            "columns": columns
         }
-
-        with open(output_path, 'w') as f:
-            yaml.dump(yaml_data, f, default_flow_style=False, sort_keys=False)
-
-        return str(output_path)
@@ -7,13 +7,145 @@ Trains on metadata from YAML files and creates a reusable model.
 
 import os
 import pickle
+from collections import Counter
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import SGDClassifier
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
+from sklearn.utils import murmurhash3_32
+from sklearn.utils.class_weight import compute_sample_weight
+
+try:
+    import joblib
+except ImportError:  # joblib ships with scikit-learn but is optional here
+    joblib = None
+
+
+def _hashed_index(token: str, n_features: int) -> int:
+    """Column index HashingVectorizer assigns to a token."""
+    h = murmurhash3_32(token, seed=0)
+    if h == -2147483648:
+        return (2147483647 - (n_features - 1)) % n_features
+    return abs(h) % n_features
+
+
+class FastLinearPredictor:
+    """
+    Specialised predict_proba for a fitted text vectorizer + linear classifier pipeline.
+
+    Metadata strings are only a handful of tokens long, so sklearn's input
+    validation and CSR construction dominate a pipeline call. This pulls the
+    vocabulary (or hashing settings), IDF weights and coefficients out of the
+    pipeline once and scores each text with a small gather + dot product.
+
+    Raises ValueError if the pipeline is not a supported TfidfVectorizer or
+    HashingVectorizer + linear model pair, or if its probabilities cannot be
+    reproduced.
+    """
+
+    # Probe texts for pipelines without a vocabulary to draw from
+    _HASHING_PROBES = ["", "email address string", "patient diagnosis code", "order status"]
+
+    # Most recently used tokens whose hashed column index is memoised
+    HASH_CACHE_MAXSIZE = 2048
+
+    def __init__(self, pipeline: Pipeline):
+        if len(pipeline.steps) != 2 or not isinstance(
+            pipeline.steps[0][1], (TfidfVectorizer, HashingVectorizer)
+        ):
+            raise ValueError("Unsupported pipeline layout")
+
+        vectorizer = pipeline.steps[0][1]
+        clf = pipeline.steps[-1][1]
+        if vectorizer.norm not in ('l1', 'l2', None):
+            raise ValueError(f"Unsupported vectorizer norm: {vectorizer.norm}")
+
+        self.classes_ = clf.classes_
+        self._analyzer = vectorizer.build_analyzer()
+        self._norm = vectorizer.norm
+        self._binary = vectorizer.binary
+        if isinstance(vectorizer, TfidfVectorizer):
+            self._vocab = vectorizer.vocabulary_
+            self._idf = vectorizer.idf_ if vectorizer.use_idf else None
+            self._sublinear_tf = vectorizer.sublinear_tf
+            probes = ["", " ".join(list(self._vocab)[:5]), " ".join(list(self._vocab)[-5:])]
+        else:
+            if vectorizer.alternate_sign:
+                raise ValueError("Unsupported HashingVectorizer with alternate_sign")
+            # No vocabulary: token -> hashed column index, memoised in a
+            # bounded LRU
+            self._vocab = None
+            self._hashed_index = lru_cache(maxsize=self.HASH_CACHE_MAXSIZE)(
+                partial(_hashed_index, n_features=vectorizer.n_features)
+            )
+            self._idf = None
+            self._sublinear_tf = False
+            probes = self._HASHING_PROBES
+        self._W = np.asarray(clf.coef_, dtype=np.float64)
+        self._b = np.asarray(clf.intercept_, dtype=np.float64)
+
+        # Linear models turn decision scores into probabilities either with a
+        # softmax or with normalised one-vs-rest sigmoids; pick whichever one
+        # reproduces the pipeline on a few probe texts.
+        expected = pipeline.predict_proba(probes)
+        scores = self._decision_function(probes)
+        for link in (self._softmax, self._ovr_sigmoid):
+            if np.allclose(link(scores), expected, rtol=1e-6, atol=1e-9):
+                self._link = link
+                break
+        else:
+            raise ValueError("Could not reproduce pipeline probabilities")
+
+    def _decision_function(self, texts: List[str]) -> np.ndarray:
+        """Compute linear decision scores for each text."""
+        scores = np.tile(self._b, (len(texts), 1))
+        index_of = self._vocab.get if self._vocab is not None else self._hashed_index
+        for row, text in enumerate(texts):
+            counts: Dict[int, int] = {}
+            for token in self._analyzer(text):
+                index = index_of(token)
+                if index is not None:
+                    counts[index] = counts.get(index, 0) + 1
+            if not counts:
+                continue
+
+            indices = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+            values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            if self._binary:
+                values[:] = 1.0
+            elif self._sublinear_tf:
+                values = 1.0 + np.log(values)
+            if self._idf is not None:
+                values *= self._idf[indices]
+            if self._norm == 'l2':
+                values /= np.sqrt(values @ values)
+            elif self._norm == 'l1':
+                values /= np.abs(values).sum()
+
+            scores[row] += self._W[:, indices] @ values
+        return scores
+
+    @staticmethod
+    def _softmax(scores: np.ndarray) -> np.ndarray:
+        if scores.shape[1] == 1:
+            scores = np.hstack([-scores, scores])
+        exp = np.exp(scores - scores.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    @staticmethod
+    def _ovr_sigmoid(scores: np.ndarray) -> np.ndarray:
+        prob = 1.0 / (1.0 + np.exp(-scores))
+        if prob.shape[1] == 1:
+            return np.hstack([1.0 - prob, prob])
+        return prob / prob.sum(axis=1, keepdims=True)
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """Predict class probabilities for each text."""
+        return self._link(self._decision_function(texts))
 
 
 class MLClassifierTrainer:
@@ -46,12 +178,40 @@ class MLClassifierTrainer:
             data_type: Column data type
 
         Returns:
-            Combined feature string for TF-IDF
+            Combined feature string for the vectorizer
         """
         # Combine all metadata into single feature string
         features = f"{column_name} {description} {data_type}"
         return features.lower()
 
+    def extract_features_batch(
+        self,
+        column_names: List[str],
+        descriptions: List[str],
+        data_types: List[str]
+    ) -> List[str]:
+        """
+        Extract feature strings for many columns at once.
+
+        Equivalent to calling extract_features() per column, without the
+        per-column method call.
+
+        Args:
+            column_names: Column names
+            descriptions: Column descriptions
+            data_types: Column data types
+
+        Returns:
+            List of combined feature strings, ready for predict_batch()
+        """
+        if not len(column_names) == len(descriptions) == len(data_types):
+            raise ValueError("Column names, descriptions and data types must have same length")
+
+        return [
+            f"{column_name} {description} {data_type}".lower()
+            for column_name, description, data_type in zip(column_names, descriptions, data_types)
+        ]
+
     def prepare_training_data(self, metadata_list: List[Dict]) -> Tuple[List[str], List[str]]:
         """
         Prepare training data from metadata list.
@@ -90,37 +250,121 @@ class MLClassifierTrainer:
 
         print(f"Training ML classifier on {len(feature_texts)} samples...")
 
-        # Create pipeline: TF-IDF → Logistic Regression
-        self.model = Pipeline([
-            (
-                'tfidf', TfidfVectorizer(
-                max_features=100,
-                lowercase=True,
-                ngram_range=(1, 2),  # Unigrams and bigrams
-                min_df=1,
-                max_df=0.9
-            )),
-            ('classifier', LogisticRegression(
-                max_iter=200,
-                random_state=self.random_state,
-                class_weight='balanced',  # Handle imbalanced classes
-                C=1.0  # Regularization strength
-            ))
-        ])
+        self.model = self._build_pipeline()
 
-        # Train the model
-        self.model.fit(feature_texts, labels)
+        # Train the model; balanced sample weights handle imbalanced classes
+        self.model.fit(
+            feature_texts,
+            labels,
+            classifier__sample_weight=compute_sample_weight('balanced', labels)
+        )
+        self.feature_names = self._hashed_feature_names(feature_texts)
 
         # Print training info
         classes_in_training = set(labels)
         print(f"Training complete")
         print(f"Classes: {', '.join(sorted(classes_in_training))}")
         print(f"Samples per class:")
+        counts = Counter(labels)
         for cls in sorted(self.classes):
-            count = labels.count(cls)
+            count = counts.get(cls, 0)
             if count > 0:
                 print(f"{cls}: {count}")
 
+    def partial_train(
+        self,
+        feature_texts: List[str],
+        labels: List[str],
+        classes: Optional[List[str]] = None
+    ) -> None:
+        """
+        Incrementally train the ML model on a new batch of data.
+
+        The feature hashing step is stateless, so only the new samples are
+        processed. The first batch starts a fresh model.
+
+        Args:
+            feature_texts: List of feature strings
+            labels: List of corresponding labels
+            classes: All classes the model may see (default: self.classes);
+                only used when starting a fresh model
+
+        Raises:
+            ValueError: If the current model does not use feature hashing
+                (e.g. one saved by an older version)
+        """
+        if not feature_texts or not labels:
+            print("Warning: No training data provided")
+            return
+
+        if len(feature_texts) != len(labels):
+            raise ValueError("Feature texts and labels must have same length")
+
+        if not self.model:
+            self.model = self._build_pipeline()
+            classes = list(classes if classes is not None else self.classes)
+        else:
+            classes = None
+
+        # Models saved before feature hashing (TF-IDF + LogisticRegression)
+        # have a fitted vocabulary and no partial_fit
+        hasher = self.model.steps[0][1]
+        classifier = self.model.steps[-1][1]
+        if not isinstance(hasher, HashingVectorizer) or not hasattr(classifier, 'partial_fit'):
+            raise ValueError("Incremental training requires a hashed model; retrain with train()")
+
+        # SGD updates its arrays in place; a memory-mapped model (load_model
+        # with mmap_mode='r') holds read-only ones, so copy those first
+        for name, value in vars(classifier).items():
+            if isinstance(value, np.ndarray) and not value.flags.writeable:
+                setattr(classifier, name, value.copy())
+
+        classifier.partial_fit(
+            hasher.transform(feature_texts),
+            labels,
+            classes=classes,
+            # Batch-local balancing; partial_fit does not accept class_weight='balanced'
+            sample_weight=compute_sample_weight('balanced', labels)
+        )
+
+    def _build_pipeline(self) -> Pipeline:
+        """Create an untrained feature hashing → linear classifier pipeline."""
+        return Pipeline([
+            (
+                'hasher', HashingVectorizer(
+                n_features=256,
+                lowercase=True,
+                ngram_range=(1, 2),  # Unigrams and bigrams
+                alternate_sign=False
+            )),
+            ('classifier', SGDClassifier(
+                loss='log_loss',  # Logistic regression, supports partial_fit
+                random_state=self.random_state
+            ))
+        ])
+
+    def _hashed_feature_names(self, feature_texts: List[str]) -> List[str]:
+        """
+        Recover readable names for the hashed feature columns.
+
+        Hashed features have no vocabulary, so each column is named after
+        the training n-grams that hash to it.
+
+        Args:
+            feature_texts: Training feature strings
+
+        Returns:
+            List of feature names, one per hashed column
+        """
+        hasher = self.model.steps[0][1]
+        analyzer = hasher.build_analyzer()
+        ngrams = sorted({ngram for text in feature_texts for ngram in analyzer(text)})
+
+        names: List[List[str]] = [[] for _ in range(hasher.n_features)]
+        for ngram in ngrams:
+            names[_hashed_index(ngram, hasher.n_features)].append(ngram)
+        return ['|'.join(group) if group else f"hash_{i}" for i, group in enumerate(names)]
+
     def predict(self, feature_text: str) -> Tuple[str, float]:
         """
         Make prediction on a single feature text.
@@ -136,7 +380,7 @@ class MLClassifierTrainer:
 
         prediction = self.model.predict([feature_text])[0]
         probabilities = self.model.predict_proba([feature_text])[0]
-        confidence = float(max(probabilities))
+        confidence = float(probabilities.max())
 
         return prediction, confidence
 
@@ -153,19 +397,22 @@ class MLClassifierTrainer:
         if not self.model:
             raise RuntimeError("Model not trained. Call train() first.")
 
-        predictions = self.model.predict(feature_texts)
-        probabilities = self.model.predict_proba(feature_texts)
+        # Score each distinct text once and fan the results back out
+        unique_texts, inverse = np.unique(np.asarray(feature_texts), return_inverse=True)
+        probabilities = self.model.predict_proba(unique_texts.tolist())
 
-        results = []
-        for pred, probs in zip(predictions, probabilities):
-            confidence = float(max(probs))
-            results.append((pred, confidence))
-
-        return results
+        # predict() would recompute the probabilities just to take the argmax
+        best = probabilities.argmax(axis=1)
+        predictions = self.model.classes_[best][inverse]
+        confidences = probabilities[np.arange(len(best)), best][inverse]
+        return list(zip(predictions.tolist(), confidences.tolist()))
 
     def save_model(self, filepath: str) -> None:
         """
-        Save trained model to pickle file.
+        Save trained model to file.
+
+        Uses joblib when available, storing NumPy arrays uncompressed so that
+        load_model can memory-map them; falls back to pickle otherwise.
 
         Args:
             filepath: Path to save model file
@@ -174,17 +421,27 @@ class MLClassifierTrainer:
             raise RuntimeError("No model to save. Train first.")
 
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'wb') as f:
-            pickle.dump(self.model, f)
+        if joblib is not None:
+            joblib.dump(self.model, filepath, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            with open(filepath, 'wb') as f:
+                pickle.dump(self.model, f, protocol=pickle.HIGHEST_PROTOCOL)
         print(f"Model saved to {filepath}")
 
     @staticmethod
-    def load_model(filepath: str) -> Pipeline:
+    def load_model(filepath: str, mmap_mode: Optional[str] = None) -> Pipeline:
         """
-        Load trained model from pickle file.
+        Load trained model from file.
+
+        Reads both joblib and plain pickle files. With joblib available,
+        mmap_mode='r' memory-maps the model's arrays so processes loading the
+        same file share its pages; such a model is read-only and suits
+        prediction only.
 
         Args:
             filepath: Path to model file
+            mmap_mode: joblib memory-map mode; the default None loads writable
+                arrays that partial_train can update
 
         Returns:
             Loaded sklearn Pipeline model
@@ -192,6 +449,9 @@ class MLClassifierTrainer:
         if not Path(filepath).exists():
             raise FileNotFoundError(f"Model file not found: {filepath}")
 
+        if joblib is not None:
+            return joblib.load(filepath, mmap_mode=mmap_mode)
+
         with open(filepath, 'rb') as f:
             model = pickle.load(f)
         return model
@@ -206,14 +466,19 @@ class MLClassifierTrainer:
         if not self.model:
             raise RuntimeError("Model not trained")
 
-        # Get TF-IDF vectorizer and classifier
-        tfidf = self.model.named_steps['tfidf']
+        vectorizer = self.model.steps[0][1]
         classifier = self.model.named_steps['classifier']
 
-        # Get feature names from TF-IDF
-        feature_names = tfidf.get_feature_names_out()
+        # Hashed features have no vocabulary; fall back to the names recovered
+        # at training time, or to the bare column indices
+        if hasattr(vectorizer, 'get_feature_names_out'):
+            feature_names = vectorizer.get_feature_names_out()
+        elif len(self.feature_names) == classifier.coef_.shape[1]:
+            feature_names = self.feature_names
+        else:
+            feature_names = [f"hash_{i}" for i in range(classifier.coef_.shape[1])]
 
-        # Get coefficients from Logistic Regression
+        # Get coefficients from the linear classifier
         # Average absolute coefficients across all classes
         coef_importance = np.abs(classifier.coef_).mean(axis=0)
 
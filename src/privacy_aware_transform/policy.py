@@ -6,9 +6,11 @@ data sensitivity, consumer identity, and usage context.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable
+from typing import Any, Dict, List, Mapping, Optional, Callable
 from enum import Enum
 
+from ._compat import DATACLASS_SLOTS
+
 
 class ConsumerType(Enum):
     """Types of data consumers."""
@@ -26,14 +28,52 @@ class SensitivityLevel(Enum):
     NON_SENSITIVE = "Non-Sensitive"
 
 
-@dataclass
+def _build_sensitivity_lookup() -> Dict[str, SensitivityLevel]:
+    """Map the accepted spellings of each sensitivity class to its enum member."""
+    lookup: Dict[str, SensitivityLevel] = {}
+    for level in SensitivityLevel:
+        for name in (level.name, level.value):
+            for variant in (name, name.replace('_', '-'), name.replace('-', '_')):
+                lookup[variant] = level
+                lookup[variant.upper()] = level
+                lookup[variant.lower()] = level
+    return lookup
+
+
+_SENSITIVITY_BY_NAME = _build_sensitivity_lookup()
+
+
+def parse_sensitivity_level(name: Any) -> Optional[SensitivityLevel]:
+    """
+    Resolve a sensitivity class name to its SensitivityLevel.
+
+    Accepts the enum names and values in any case, with '-' or '_'
+    (e.g. "PII", "pii", "Non-Sensitive", "NON_SENSITIVE", "Non_Sensitive").
+
+    Args:
+        name: Sensitivity class name
+
+    Returns:
+        SensitivityLevel, or None if the name is not recognised
+    """
+    if not isinstance(name, str):
+        return None
+    level = _SENSITIVITY_BY_NAME.get(name)
+    if level is None:
+        # Unusual spellings fall back to the normalised enum name
+        level = SensitivityLevel.__members__.get(name.strip().upper().replace('-', '_'))
+    return level
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TransformationRule:
     """Defines how to transform data based on sensitivity and consumer."""
     sensitivity: SensitivityLevel
     consumer_type: ConsumerType
     transformation_type: str  # mask, hash, tokenize, aggregate, keep
-    parameters: Dict[str, any] = field(default_factory=dict)
+    parameters: Mapping[str, Any] = field(default_factory=dict)
 
+    # Explicit so that the unhashable parameters dict stays out of the hash
     def __hash__(self):
         return hash((self.sensitivity, self.consumer_type, self.transformation_type))
 
@@ -43,7 +83,7 @@ class TransformationRule:
                 self.transformation_type == other.transformation_type)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ConsumerPolicy:
     """
     Defines privacy transformation policies for different consumer types.
@@ -56,9 +96,70 @@ class ConsumerPolicy:
 
     def get_rule(self, sensitivity: SensitivityLevel) -> Optional[TransformationRule]:
         """Get transformation rule for given sensitivity level."""
+        # Read straight from rules so that edits to it always apply
         return self.rules.get(sensitivity)
 
 
+class _FrozenParameters(dict):
+    """
+    Read-only rule parameters, safe to share between rules.
+
+    A dict subclass rather than a MappingProxyType, so that rules holding it
+    still pickle, deep-copy and convert with dataclasses.asdict().
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("default rule parameters are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+# Shared, read-only parameter sets for the default rules
+_TOKEN16 = _FrozenParameters({"token_length": 16})
+_SHA256 = _FrozenParameters({"algorithm": "sha256"})
+_MASK_EDGES = _FrozenParameters({"keep_positions": (0, -1), "mask_char": "*"})
+_MASK_ALL = _FrozenParameters({"keep_positions": (), "mask_char": "*"})
+_COUNT = _FrozenParameters({"aggregate_type": "count"})
+_EMPTY = _FrozenParameters()
+
+# (consumer type, policy name, [(sensitivity, transformation type, parameters)])
+_DEFAULT_POLICIES = (
+    # Internal Analysts - more data utility, less privacy
+    (ConsumerType.INTERNAL_ANALYST, "Internal Analytics", (
+        (SensitivityLevel.PII, "tokenize", _TOKEN16),
+        (SensitivityLevel.PHI, "tokenize", _TOKEN16),
+        (SensitivityLevel.SENSITIVE, "mask", _MASK_EDGES),
+        (SensitivityLevel.NON_SENSITIVE, "keep", _EMPTY),
+    )),
+    # External Partners - strict privacy, limited utility
+    (ConsumerType.EXTERNAL_PARTNER, "External Partnership", (
+        (SensitivityLevel.PII, "hash", _SHA256),
+        (SensitivityLevel.PHI, "hash", _SHA256),
+        (SensitivityLevel.SENSITIVE, "mask", _MASK_ALL),
+        (SensitivityLevel.NON_SENSITIVE, "keep", _EMPTY),
+    )),
+    # Reporting - aggregation and masking
+    (ConsumerType.REPORTING, "Reporting", (
+        (SensitivityLevel.PII, "mask", _MASK_ALL),
+        (SensitivityLevel.PHI, "mask", _MASK_ALL),
+        (SensitivityLevel.SENSITIVE, "aggregate", _COUNT),
+        (SensitivityLevel.NON_SENSITIVE, "keep", _EMPTY),
+    )),
+    # Public - maximum privacy, minimal data
+    (ConsumerType.PUBLIC, "Public", (
+        (SensitivityLevel.PII, "hash", _SHA256),
+        (SensitivityLevel.PHI, "hash", _SHA256),
+        (SensitivityLevel.SENSITIVE, "aggregate", _COUNT),
+        (SensitivityLevel.NON_SENSITIVE, "keep", _EMPTY),
+    )),
+)
+
+
 class PolicyEngine:
     """
     Manages and applies privacy policies.
@@ -73,139 +174,20 @@ class PolicyEngine:
 
     def _init_default_policies(self) -> None:
         """Initialize default privacy policies."""
-
-        # Policy for Internal Analysts - more data utility, less privacy
-        internal_policy = ConsumerPolicy(
-            name="Internal Analytics",
-            consumer_type=ConsumerType.INTERNAL_ANALYST,
-            rules={
-                SensitivityLevel.PII: TransformationRule(
-                    sensitivity=SensitivityLevel.PII,
-                    consumer_type=ConsumerType.INTERNAL_ANALYST,
-                    transformation_type="tokenize",
-                    parameters={"token_length": 16}
-                ),
-                SensitivityLevel.PHI: TransformationRule(
-                    sensitivity=SensitivityLevel.PHI,
-                    consumer_type=ConsumerType.INTERNAL_ANALYST,
-                    transformation_type="tokenize",
-                    parameters={"token_length": 16}
-                ),
-                SensitivityLevel.SENSITIVE: TransformationRule(
-                    sensitivity=SensitivityLevel.SENSITIVE,
-                    consumer_type=ConsumerType.INTERNAL_ANALYST,
-                    transformation_type="mask",
-                    parameters={"keep_positions": [0, -1], "mask_char": "*"}
-                ),
-                SensitivityLevel.NON_SENSITIVE: TransformationRule(
-                    sensitivity=SensitivityLevel.NON_SENSITIVE,
-                    consumer_type=ConsumerType.INTERNAL_ANALYST,
-                    transformation_type="keep",
-                    parameters={}
-                ),
-            }
-        )
-
-        # Policy for External Partners - strict privacy, limited utility
-        external_policy = ConsumerPolicy(
-            name="External Partnership",
-            consumer_type=ConsumerType.EXTERNAL_PARTNER,
-            rules={
-                SensitivityLevel.PII: TransformationRule(
-                    sensitivity=SensitivityLevel.PII,
-                    consumer_type=ConsumerType.EXTERNAL_PARTNER,
-                    transformation_type="hash",
-                    parameters={"algorithm": "sha256"}
-                ),
-                SensitivityLevel.PHI: TransformationRule(
-                    sensitivity=SensitivityLevel.PHI,
-                    consumer_type=ConsumerType.EXTERNAL_PARTNER,
-                    transformation_type="hash",
-                    parameters={"algorithm": "sha256"}
-                ),
-                SensitivityLevel.SENSITIVE: TransformationRule(
-                    sensitivity=SensitivityLevel.SENSITIVE,
-                    consumer_type=ConsumerType.EXTERNAL_PARTNER,
-                    transformation_type="mask",
-                    parameters={"keep_positions": [], "mask_char": "*"}
-                ),
-                SensitivityLevel.NON_SENSITIVE: TransformationRule(
-                    sensitivity=SensitivityLevel.NON_SENSITIVE,
-                    consumer_type=ConsumerType.EXTERNAL_PARTNER,
-                    transformation_type="keep",
-                    parameters={}
-                ),
-            }
-        )
-
-        # Policy for Reporting - aggregation and masking
-        reporting_policy = ConsumerPolicy(
-            name="Reporting",
-            consumer_type=ConsumerType.REPORTING,
-            rules={
-                SensitivityLevel.PII: TransformationRule(
-                    sensitivity=SensitivityLevel.PII,
-                    consumer_type=ConsumerType.REPORTING,
-                    transformation_type="mask",
-                    parameters={"keep_positions": [], "mask_char": "*"}
-                ),
-                SensitivityLevel.PHI: TransformationRule(
-                    sensitivity=SensitivityLevel.PHI,
-                    consumer_type=ConsumerType.REPORTING,
-                    transformation_type="mask",
-                    parameters={"keep_positions": [], "mask_char": "*"}
-                ),
-                SensitivityLevel.SENSITIVE: TransformationRule(
-                    sensitivity=SensitivityLevel.SENSITIVE,
-                    consumer_type=ConsumerType.REPORTING,
-                    transformation_type="aggregate",
-                    parameters={"aggregate_type": "count"}
-                ),
-                SensitivityLevel.NON_SENSITIVE: TransformationRule(
-                    sensitivity=SensitivityLevel.NON_SENSITIVE,
-                    consumer_type=ConsumerType.REPORTING,
-                    transformation_type="keep",
-                    parameters={}
-                ),
-            }
-        )
-
-        # Policy for Public - maximum privacy, minimal data
-        public_policy = ConsumerPolicy(
-            name="Public",
-            consumer_type=ConsumerType.PUBLIC,
-            rules={
-                SensitivityLevel.PII: TransformationRule(
-                    sensitivity=SensitivityLevel.PII,
-                    consumer_type=ConsumerType.PUBLIC,
-                    transformation_type="hash",
-                    parameters={"algorithm": "sha256"}
-                ),
-                SensitivityLevel.PHI: TransformationRule(
-                    sensitivity=SensitivityLevel.PHI,
-                    consumer_type=ConsumerType.PUBLIC,
-                    transformation_type="hash",
-                    parameters={"algorithm": "sha256"}
-                ),
-                SensitivityLevel.SENSITIVE: TransformationRule(
-                    sensitivity=SensitivityLevel.SENSITIVE,
-                    consumer_type=ConsumerType.PUBLIC,
-                    transformation_type="aggregate",
-                    parameters={"aggregate_type": "count"}
-                ),
-                SensitivityLevel.NON_SENSITIVE: TransformationRule(
-                    sensitivity=SensitivityLevel.NON_SENSITIVE,
-                    consumer_type=ConsumerType.PUBLIC,
-                    transformation_type="keep",
-                    parameters={}
-                ),
-            }
-        )
-
-        self.policies["internal_analyst"] = internal_policy
-        self.policies["external_partner"] = external_policy
-        self.policies["reporting"] = reporting_policy
-        self.policies["public"] = public_policy
+        for consumer_type, name, rules in _DEFAULT_POLICIES:
+            self.policies[consumer_type.value] = ConsumerPolicy(
+                name=name,
+                consumer_type=consumer_type,
+                rules={
+                    sensitivity: TransformationRule(
+                        sensitivity=sensitivity,
+                        consumer_type=consumer_type,
+                        transformation_type=transformation_type,
+                        parameters=parameters
+                    )
+                    for sensitivity, transformation_type, parameters in rules
+                }
+            )
 
     def get_policy(self, consumer_type: str) -> Optional[ConsumerPolicy]:
         """
@@ -239,16 +221,17 @@ class PolicyEngine:
         Returns:
             TransformationRule or None
         """
-        policy = self.get_policy(consumer_type)
-        if not policy:
+        # Convert sensitivity string to enum
+        sens_enum = parse_sensitivity_level(sensitivity)
+        if sens_enum is None:
             return None
 
-        # Convert sensitivity string to enum
-        try:
-            sens_enum = SensitivityLevel[sensitivity.upper().replace('-', '_')]
-            return policy.get_rule(sens_enum)
-        except KeyError:
+        # Resolved through the live policies on every call, so policies that
+        # are replaced or edited after registration take effect immediately
+        policy = self.policies.get(consumer_type)
+        if policy is None:
             return None
+        return policy.rules.get(sens_enum)
 
     def list_policies(self) -> List[str]:
         """List all available policy names."""
@@ -4,17 +4,23 @@ Data Transformation Module
 Implements privacy-preserving transformations:
 - Masking: Replace characters with mask character
 - Hashing: Cryptographic hash (one-way, non-reversible)
-- Tokenization: Consistent pseudonymization using keyed HMAC
+- Tokenization: Consistent pseudonymization using keyed HMAC (or keyed BLAKE3)
 - Aggregation: Group and summarize data
 - Keep: No transformation (pass-through)
 """
 
 import hashlib
-import hmac
-from typing import Any, Optional, Dict, List
-from functools import lru_cache
+import numpy as np
+from typing import Any, Optional, Dict, Iterable, List
+from functools import partial
+from itertools import chain, islice
 import os
 
+try:
+    import blake3
+except ImportError:  # blake3 is optional
+    blake3 = None
+
 
 class Transformer:
     """Base class for data transformations."""
@@ -23,10 +29,29 @@ class Transformer:
         """Transform a single value. To be overridden by subclasses."""
         raise NotImplementedError
 
+    def transform_column(self, values: Iterable[Any]) -> List[Any]:
+        """
+        Transform every value of a column.
+
+        Subclasses may override this with a specialised loop; the default
+        applies transform() to each value.
+
+        Args:
+            values: Column values
+
+        Returns:
+            List of transformed values
+        """
+        transform = self.transform
+        return [transform(value) for value in values]
+
 
 class MaskingTransformer(Transformer):
     """Masks data by replacing characters with a mask character."""
 
+    # Rows per NumPy character matrix in transform_column
+    MATRIX_CHUNK_ROWS = 65_536
+
     def __init__(self, keep_positions: List[int] = None, mask_char: str = "*"):
         """
         Initialize masking transformer.
@@ -37,6 +62,19 @@ class MaskingTransformer(Transformer):
         """
         self.keep_positions = keep_positions if keep_positions else []
         self.mask_char = mask_char
+        self._is_empty_mode = not self.keep_positions
+
+        # Lengths of the leading and trailing runs of kept positions; strings
+        # no longer than their sum are kept whole. Multi-character masks
+        # change the output length, so they never take that shortcut.
+        positions = set(self.keep_positions) if len(mask_char) == 1 else ()
+        head = 0
+        while head in positions:
+            head += 1
+        tail = 0
+        while -(tail + 1) in positions:
+            tail += 1
+        self._kept_span = head + tail
 
     def transform(self, value: Any) -> str:
         """
@@ -48,37 +86,156 @@ class MaskingTransformer(Transformer):
         Returns:
             Masked string
         """
-        if value is None or value == "":
+        if value.__class__ is str:
+            value_str = value
+        elif value is None or value == "":
             return ""
+        else:
+            value_str = str(value)
 
-        value_str = str(value)
-
-        if not self.keep_positions:
-            # Mask entire value
+        if self._is_empty_mode:
+            # Mask entire value ("" stays "")
             return self.mask_char * len(value_str)
 
+        length = len(value_str)
+        if length <= self._kept_span:
+            # Every position is kept (covers "" too)
+            return value_str
+
         # Keep certain positions
-        result = list(self.mask_char * len(value_str))
+        result = list(self.mask_char * length)
         for pos in self.keep_positions:
             if pos < 0:
-                pos = len(value_str) + pos
-            if 0 <= pos < len(value_str):
+                pos = length + pos
+            if 0 <= pos < length:
                 result[pos] = value_str[pos]
 
         return ''.join(result)
 
+    def transform_column(self, values: Iterable[Any]) -> List[Any]:
+        """
+        Mask every value of a column.
+
+        Args:
+            values: Column values
+
+        Returns:
+            List of masked strings
+        """
+        mask_char = self.mask_char
+        if self._is_empty_mode:
+            # Plain str values need no str() call; "" masks to ""
+            return [
+                mask_char * len(value) if value.__class__ is str
+                else ("" if value is None or value == "" else mask_char * len(str(value)))
+                for value in values
+            ]
+
+        strings = [
+            value if value.__class__ is str
+            else ("" if value is None or value == "" else str(value))
+            for value in values
+        ]
+        # The character-matrix path relies on NumPy dropping trailing NULs,
+        # so it needs a single, non-NUL mask character
+        if len(mask_char) != 1 or mask_char == "\x00":
+            transform = self.transform
+            return [transform(value) for value in strings]
+        return self._mask_matrix(strings)
+
+    def _mask_matrix(self, strings: List[str]) -> List[str]:
+        """
+        Mask strings keeping self.keep_positions, MATRIX_CHUNK_ROWS at a time.
+
+        Working in fixed-size row chunks bounds the size of the intermediate
+        character matrices on long columns.
+
+        Args:
+            strings: Column values as strings ("" for empty values)
+
+        Returns:
+            List of masked strings
+        """
+        chunk_rows = self.MATRIX_CHUNK_ROWS
+        if len(strings) <= chunk_rows:
+            return self._mask_chunk(strings)
+
+        masked = []
+        for start in range(0, len(strings), chunk_rows):
+            masked.extend(self._mask_chunk(strings[start:start + chunk_rows]))
+        return masked
+
+    def _mask_chunk(self, strings: List[str]) -> List[str]:
+        """
+        Mask strings keeping self.keep_positions, as one NumPy character matrix.
+
+        Each string becomes a row of single characters, padded with NULs that
+        NumPy drops again on output. The row is filled with the mask
+        character up to the string's length and the kept positions are copied
+        across with fancy indexing.
+
+        Args:
+            strings: Column values as strings ("" for empty values)
+
+        Returns:
+            List of masked strings
+        """
+        n = len(strings)
+        lengths = np.fromiter(map(len, strings), dtype=np.intp, count=n)
+        width = int(lengths.max()) if n else 0
+        transform = self.transform
+        if width <= self._kept_span:
+            # Every position of every string is kept
+            return strings
+        if width * n > 4 * int(lengths.sum()) + 4096:
+            # A few long values would make the padded matrix mostly padding
+            return [transform(value) for value in strings]
+
+        source = np.array(strings, dtype=f"U{width}")
+        chars = source.view("U1").reshape(n, width)
+        result = np.where(np.arange(width) < lengths[:, None], self.mask_char, "").astype("U1")
+
+        rows = np.arange(n)
+        for pos in self.keep_positions:
+            index = lengths + pos if pos < 0 else np.full(n, pos, dtype=np.intp)
+            keep = (index >= 0) & (index < lengths)
+            result[rows[keep], index[keep]] = chars[rows[keep], index[keep]]
+
+        masked = result.view(f"U{width}").ravel().tolist()
+
+        # Values ending in NUL do not survive the round trip; redo them
+        for i in np.flatnonzero(np.char.str_len(source) != lengths).tolist():
+            masked[i] = transform(strings[i])
+        return masked
+
 
 class HashingTransformer(Transformer):
     """Applies cryptographic hash to data (one-way, non-reversible)."""
 
+    # Leading values transform_column inspects before deciding to deduplicate
+    DEDUPE_SAMPLE = 1024
+
     def __init__(self, algorithm: str = "sha256"):
         """
         Initialize hashing transformer.
 
         Args:
             algorithm: Hash algorithm (sha256, sha512, md5, etc.)
+
+        Raises:
+            ValueError: If the algorithm is unavailable or has no fixed
+                digest size (e.g. shake_128)
         """
         self.algorithm = algorithm
+        # Resolve the constructor once; hashlib.new looks the name up per call.
+        # hashlib.new accepts names in any case, so normalise before the lookup.
+        name = algorithm.lower()
+        ctor = getattr(hashlib, name, None) if name in hashlib.algorithms_guaranteed else None
+        self._ctor = ctor if ctor is not None else partial(hashlib.new, algorithm)
+
+        # Probe once so a misconfigured algorithm fails here, not on every row
+        if self._ctor().digest_size == 0:
+            raise ValueError(f"Hash algorithm {algorithm!r} has no fixed digest size")
 
     def transform(self, value: Any) -> str:
         """
@@ -93,10 +250,80 @@ class HashingTransformer(Transformer):
         if value is None or value == "":
             return ""
 
+        # Hashed in the constructor call; hexdigest() is one C call, so it
+        # beats digest().hex()
         value_str = str(value).encode('utf-8')
-        hash_obj = hashlib.new(self.algorithm)
-        hash_obj.update(value_str)
-        return hash_obj.hexdigest()
+        return self._ctor(value_str).hexdigest()
+
+    def transform_column(self, values: Iterable[Any]) -> List[str]:
+        """
+        Hash every value of a column in a single pass.
+
+        hashlib dispatches to OpenSSL, which uses the CPU's SHA extensions
+        when they are available.
+
+        Args:
+            values: Column values
+
+        Returns:
+            List of hexadecimal hash strings
+        """
+        ctor = self._ctor
+        values = iter(values)
+
+        # Repeated str values are hashed once. Deduplication only pays off
+        # for low-cardinality string columns, so decide from a leading sample;
+        # other columns (ints, floats, ...) go straight to the plain path.
+        sample = list(islice(values, self.DEDUPE_SAMPLE))
+        strings = [value for value in sample if value.__class__ is str]
+        values = chain(sample, values)
+
+        if 2 * len(strings) > len(sample) and 2 * len(set(strings)) <= len(strings):
+            digests: Dict[str, str] = {}
+            get = digests.get
+            hashed = []
+            append = hashed.append
+            for value in values:
+                if value.__class__ is str:
+                    digest = get(value)
+                    if digest is None:
+                        digest = ctor(value.encode('utf-8')).hexdigest() if value else ""
+                        digests[value] = digest
+
+                    append(digest)
+                else:
+                    append(self.transform(value))
+            return hashed
+
+        # Plain str values (the common case) skip the str() call and the
+        # None test
+        return [
+            (ctor(value.encode('utf-8')).hexdigest() if value else "")
+            if value.__class__ is str
+            else (
+                "" if value is None or value == ""
+                else ctor(str(value).encode('utf-8')).hexdigest()
+            )
+            for value in values
+
+        ]
+
+    def transform_bytes(self, values: Iterable[Optional[bytes]]) -> List[str]:
+        """
+        Hash values that are already UTF-8 encoded.
+
+        Gives the same digests as transform_column() on the decoded strings,
+        without a decode/encode round trip for callers that already hold
+        bytes (e.g. binary Arrow or raw CSV columns).
+
+        Args:
+            values: UTF-8 encoded values (None or empty for missing)
+
+        Returns:
+            List of hexadecimal hash strings
+        """
+        ctor = self._ctor
+        return [ctor(value).hexdigest() if value else "" for value in values]
 
 
 class TokenizationTransformer(Transformer):
@@ -106,15 +333,24 @@ class TokenizationTransformer(Transformer):
     Same input value always maps to same token (deterministic).
     Different secrets produce different tokens (key-based).
     Non-reversible without the key.
+
+    Tokens are HMAC-SHA256 by default. With use_blake3 they come from
+    BLAKE3's keyed mode instead, which is faster on short values but
+    produces different tokens for the same key.
     """
 
-    def __init__(self, secret_key: Optional[str] = None, token_length: int = 16):
+    CACHE_MAXSIZE = 100_000
+
+    def __init__(self, secret_key: Optional[str] = None, token_length: int = 16,
+                 use_blake3: bool = False):
         """
         Initialize tokenization transformer.
 
         Args:
             secret_key: Secret key for HMAC (random if not provided)
             token_length: Length of output token (truncated from hash)
+            use_blake3: Derive tokens with keyed BLAKE3 instead of
+                HMAC-SHA256 (requires the blake3 package)
         """
         if secret_key is None:
             # Generate a random secret key (or use environment variable for consistency)
@@ -122,8 +358,33 @@ class TokenizationTransformer(Transformer):
         
         self.secret_key = secret_key.encode('utf-8') if isinstance(secret_key, str) else secret_key
         self.token_length = token_length
+        self.use_blake3 = use_blake3
+
+        # Keyed BLAKE3 hasher, or None for HMAC-SHA256. BLAKE3 keys are
+        # exactly 32 bytes, so other keys are condensed with SHA-256.
+        self._blake3 = None
+        if use_blake3:
+            if blake3 is None:
+                raise ImportError("use_blake3 requires the 'blake3' package")
+            key = self.secret_key
+            if len(key) != 32:
+                key = hashlib.sha256(key).digest()
+            self._blake3 = partial(blake3.blake3, key=key)
+
+        # HMAC-SHA256 inner/outer hash states after absorbing the padded key
+        # (RFC 2104); each value only copies and extends them
+        key = self.secret_key
+        block_size = hashlib.sha256().block_size
+        if len(key) > block_size:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(block_size, b'\x00')
+        self._inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+        self._outer = hashlib.sha256(bytes(b ^ 0x5c for b in key))
+
+        # Tokens keyed by the value's string form; cleared when it grows past
+        # CACHE_MAXSIZE rather than evicting entry by entry
+        self._cache: Dict[str, str] = {}
 
-    @lru_cache(maxsize=10000)
     def transform(self, value: Any) -> str:
         """
         Generate consistent token for value.
@@ -137,10 +398,96 @@ class TokenizationTransformer(Transformer):
         if value is None or value == "":
             return ""
 
-        value_str = str(value).encode('utf-8')
-        hmac_obj = hmac.new(self.secret_key, value_str, hashlib.sha256)
-        token = hmac_obj.hexdigest()[:self.token_length]
-        return f"TOKEN_{token}"
+        value_str = str(value)
+        token = self._cache.get(value_str)
+        if token is None:
+            token = f"TOKEN_{self._keyed_hexdigest(value_str.encode('utf-8'))[:self.token_length]}"
+            if len(self._cache) >= self.CACHE_MAXSIZE:
+                self._cache.clear()
+            self._cache[value_str] = token
+        return token
+
+
+    def transform_column(self, values: Iterable[Any]) -> List[str]:
+        """
+        Tokenize every value of a column.
+
+        Same tokens as transform(), with the cache and hash states bound to
+        locals once for the whole column instead of per value.
+
+        Args:
+            values: Column values
+
+        Returns:
+            List of tokens
+        """
+        cache = self._cache
+        cache_get = cache.get
+        inner_copy = self._inner.copy
+        outer_copy = self._outer.copy
+        keyed = self._blake3
+        token_length = self.token_length
+        max_size = self.CACHE_MAXSIZE
+
+        tokens = []
+        append = tokens.append
+        for value in values:
+            if value is None or value == "":
+                append("")
+                continue
+
+            value_str = str(value)
+            token = cache_get(value_str)
+            if token is None:
+                if keyed is not None:
+                    digest = keyed(value_str.encode('utf-8')).hexdigest()
+                else:
+                    inner = inner_copy()
+                    inner.update(value_str.encode('utf-8'))
+                    outer = outer_copy()
+                    outer.update(inner.digest())
+                    digest = outer.hexdigest()
+                token = f"TOKEN_{digest[:token_length]}"
+                if len(cache) >= max_size:
+                    cache.clear()
+                cache[value_str] = token
+            append(token)
+        return tokens
+
+    def transform_bytes(self, values: Iterable[Optional[bytes]]) -> List[str]:
+        """
+        Tokenize values that are already UTF-8 encoded.
+
+        Gives the same tokens as transform_column() on the decoded strings,
+        without a decode/encode round trip. The token cache is keyed by str,
+        so it is bypassed here.
+
+        Args:
+            values: UTF-8 encoded values (None or empty for missing)
+
+        Returns:
+            List of tokens
+        """
+        keyed_hexdigest = self._keyed_hexdigest
+        token_length = self.token_length
+        return [
+            f"TOKEN_{keyed_hexdigest(value)[:token_length]}" if value else ""
+            for value in values
+        ]
+
+    def _keyed_hexdigest(self, data: bytes) -> str:
+        """Compute the keyed digest of data (BLAKE3 or HMAC-SHA256), as hex."""
+        if self._blake3 is not None:
+            return self._blake3(data).hexdigest()
+        return self._hmac_hexdigest(data)
+
+    def _hmac_hexdigest(self, data: bytes) -> str:
+        """Compute HMAC-SHA256 of data under the secret key, as hex."""
+        inner = self._inner.copy()
+        inner.update(data)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
 
 
 class KeepTransformer(Transformer):
@@ -158,6 +505,10 @@ class KeepTransformer(Transformer):
         """
         return value
 
+    def transform_column(self, values: Iterable[Any]) -> List[Any]:
+        """Return the column values unchanged."""
+        return list(values)
+
 
 class TransformationEngine:
     """
@@ -170,6 +521,15 @@ class TransformationEngine:
     def __init__(self):
         """Initialize transformation engine."""
         self.transformers: Dict[str, Transformer] = {}
+        # Secret shared by every tokenizer created without an explicit key,
+        # resolved on first use
+        self._default_secret: Optional[str] = None
+
+    def _get_default_secret(self) -> str:
+        """Return the engine-wide tokenization secret, resolving it once."""
+        if self._default_secret is None:
+            self._default_secret = os.environ.get('PRIVACY_SECRET_KEY', os.urandom(32).hex())
+        return self._default_secret
 
     def get_transformer(self, transform_type: str, parameters: Dict[str, Any] = None) -> Transformer:
         """
@@ -185,15 +545,11 @@ class TransformationEngine:
         if parameters is None:
             parameters = {}
 
-        # Convert unhashable types to strings for cache key
-        cache_params = {}
-        for k, v in parameters.items():
-            if isinstance(v, list):
-                cache_params[k] = tuple(v)
-            else:
-                cache_params[k] = v
-        
-        cache_key = (transform_type, tuple(sorted(cache_params.items())))
+        # Convert unhashable lists to tuples; a frozenset keys the parameters
+        # independently of their order without sorting them
+        cache_key = (transform_type, frozenset(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in parameters.items()
+        ))
 
         if cache_key not in self.transformers:
             if transform_type == "mask":
@@ -206,9 +562,15 @@ class TransformationEngine:
                     algorithm=parameters.get("algorithm", "sha256")
                 )
             elif transform_type == "tokenize":
+                secret_key = parameters.get("secret_key")
+                if secret_key is None:
+                    # One default key per engine, so that tokenizers differing
+                    # only in other parameters stay consistent with each other
+                    secret_key = self._get_default_secret()
                 transformer = TokenizationTransformer(
-                    secret_key=parameters.get("secret_key"),
-                    token_length=parameters.get("token_length", 16)
+                    secret_key=secret_key,
+                    token_length=parameters.get("token_length", 16),
+                    use_blake3=parameters.get("use_blake3", False)
                 )
             elif transform_type == "keep":
                 transformer = KeepTransformer()
@@ -222,27 +584,31 @@ class TransformationEngine:
 
     def apply_transformation(
         self,
-        data: List[Any],
+        data: Iterable[Any],
         transform_type: str,
         parameters: Dict[str, Any] = None
     ) -> List[Any]:
         """
-        Apply transformation to a list of values.
+        Apply transformation to a sequence of values.
 
         Args:
-            data: List of values to transform
+            data: Values to transform (list, array or other iterable)
             transform_type: Type of transformation
             parameters: Parameters for the transformer
 
         Returns:
             List of transformed values
         """
+        if transform_type == "keep":
+            # Pass-through: copy the values without a transformer call each
+            return list(data)
+
         transformer = self.get_transformer(transform_type, parameters)
-        return [transformer.transform(value) for value in data]
+        return transformer.transform_column(data)
 
     def apply_column_transformation(
         self,
-        column_data: List[Any],
+        column_data: Iterable[Any],
         sensitivity_class: str,
         consumer_type: str,
         policy_engine: 'PolicyEngine'
@@ -251,7 +617,7 @@ class TransformationEngine:
         Apply transformation to a column based on sensitivity and consumer policy.
 
         Args:
-            column_data: List of values in the column
+            column_data: Values in the column (list, array or other iterable)
             sensitivity_class: Sensitivity class (PII, PHI, Sensitive, Non-Sensitive)
             consumer_type: Consumer type identifier
             policy_engine: PolicyEngine instance
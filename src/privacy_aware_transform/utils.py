@@ -3,28 +3,73 @@ Utility functions for the privacy-aware data transformation framework.
 """
 
 import pandas as pd
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 from .metadata import TableMetadata
 from .classifier import ClassificationResult, SensitivityClassifier
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional
+    pa = None
+
 
 def load_csv_data(filepath: str) -> pd.DataFrame:
     """Load CSV data into a DataFrame."""
     return pd.read_csv(filepath)
 
 
-def save_csv_data(df: pd.DataFrame, filepath: str) -> None:
-    """Save DataFrame to CSV."""
+def save_csv_data(df: pd.DataFrame, filepath: str, use_pyarrow: bool = False) -> None:
+    """
+    Save DataFrame to CSV.
+
+    Args:
+        df: DataFrame to save
+        filepath: Output CSV path
+        use_pyarrow: Write with pyarrow's multi-threaded CSV writer when
+            pyarrow is installed. Its formatting differs from
+            DataFrame.to_csv (e.g. booleans as true/false, timestamps and
+            floats), so it is opt-in. Falls back to DataFrame.to_csv when
+            pyarrow is missing or cannot convert or write a column.
+    """
+    if use_pyarrow and pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pa_csv.write_csv(
+                table, filepath,
+                write_options=pa_csv.WriteOptions(include_header=True, quoting_style="needed")
+            )
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Unsupported column types (mixed objects, lists, structs, ...)
+            pass
+
     df.to_csv(filepath, index=False)
 
 
+def _column_values(series: pd.Series):
+    """
+    Return a column's values as Python objects for the transformers.
+
+    Object columns already hold Python objects, so their backing array is
+    used as-is instead of being copied into a list. Other dtypes are boxed
+    with tolist(), which is faster than iterating the Series and yields the
+    same Python scalars and Timestamps.
+    """
+    if series.dtype == object:
+        return series.to_numpy(copy=False)
+    return series.tolist()
+
+
 def apply_transformations_to_dataframe(
     df: pd.DataFrame,
     table_metadata: TableMetadata,
     classifications: Dict[str, ClassificationResult],
     consumer_type: str,
     transformation_engine: 'TransformationEngine',
-    policy_engine: 'PolicyEngine'
+    policy_engine: 'PolicyEngine',
+    max_workers: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Apply transformations to entire DataFrame based on classifications and policy.
@@ -36,29 +81,121 @@ def apply_transformations_to_dataframe(
         consumer_type: Consumer type identifier
         transformation_engine: TransformationEngine instance
         policy_engine: PolicyEngine instance
+        max_workers: Transform columns on a thread pool of this size when
+            greater than 1. Hashing only releases the GIL for values over
+            2 KiB, so this mainly helps free-threaded builds or long values.
 
     Returns:
-        Transformed DataFrame
+        Transformed DataFrame. Columns that are not transformed share their
+        data with df instead of being copied.
     """
-    transformed_df = df.copy()
+    # Assemble the output once instead of copying df and overwriting columns
+    columns = {}
+    # Transformers resolved up front, so that worker threads never race to
+    # create (and randomly key) the same cached transformer
+    jobs = {}
 
     for column_name in df.columns:
         if column_name not in classifications:
             # Skip columns not in metadata
+            columns[column_name] = df[column_name]
             continue
 
         classification = classifications[column_name]
         sensitivity_class = classification.sensitivity_class
 
-        # Apply transformation
-        transformed_df[column_name] = transformation_engine.apply_column_transformation(
-            df[column_name].tolist(),
-            sensitivity_class,
-            consumer_type,
-            policy_engine
+        rule = policy_engine.get_transformation_rule(consumer_type, sensitivity_class)
+        if not rule or rule.transformation_type == "keep":
+            # Default: keep data unchanged
+            columns[column_name] = df[column_name]
+            continue
+
+        jobs[column_name] = transformation_engine.get_transformer(
+            rule.transformation_type,
+            rule.parameters
         )
 
-    return transformed_df
+    def transform(column_name):
+        return jobs[column_name].transform_column(_column_values(df[column_name]))
+
+    # Apply transformations
+    if max_workers is not None and max_workers > 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            columns.update(zip(jobs, executor.map(transform, jobs)))
+    else:
+        for column_name in jobs:
+            columns[column_name] = transform(column_name)
+
+    return pd.DataFrame(columns, index=df.index, columns=df.columns, copy=False)
+
+
+def apply_transformations_multi_consumer(
+    df: pd.DataFrame,
+    table_metadata: TableMetadata,
+    classifications: Dict[str, ClassificationResult],
+    consumer_types: List[str],
+    transformation_engine: 'TransformationEngine',
+    policy_engine: 'PolicyEngine'
+) -> Dict[str, pd.DataFrame]:
+    """
+    Apply transformations for several consumer types in a single pass.
+
+    Each column is transformed once per distinct transformer across the
+    consumers, and the result is shared by every consumer whose policy
+    resolves to that transformer.
+
+    Args:
+        df: Input DataFrame
+        table_metadata: Table metadata
+        classifications: Dictionary of column classifications
+        consumer_types: Consumer type identifiers
+        transformation_engine: TransformationEngine instance
+        policy_engine: PolicyEngine instance
+
+    Returns:
+        Dictionary mapping consumer type to its transformed DataFrame
+    """
+    # Output columns per consumer, assembled into DataFrames at the end
+    transformed = {consumer_type: {} for consumer_type in consumer_types}
+
+    for column_name in df.columns:
+        if column_name not in classifications:
+            # Skip columns not in metadata
+            for consumer_columns in transformed.values():
+                consumer_columns[column_name] = df[column_name]
+            continue
+
+        sensitivity_class = classifications[column_name].sensitivity_class
+        # Extracted on first use; pass-through consumers never need it
+        column_data = None
+
+        # Transformed values keyed by the (cached) transformer instance
+        by_transformer = {}
+        for consumer_type in consumer_types:
+            rule = policy_engine.get_transformation_rule(consumer_type, sensitivity_class)
+            if not rule or rule.transformation_type == "keep":
+                # Default: keep data unchanged
+                transformed[consumer_type][column_name] = df[column_name]
+                continue
+
+            transformer = transformation_engine.get_transformer(
+                rule.transformation_type, rule.parameters
+            )
+
+            if transformer not in by_transformer:
+                if column_data is None:
+                    column_data = _column_values(df[column_name])
+                by_transformer[transformer] = transformation_engine.apply_transformation(
+                    column_data,
+                    rule.transformation_type,
+                    rule.parameters
+                )
+            transformed[consumer_type][column_name] = by_transformer[transformer]
+
+    return {
+        consumer_type: pd.DataFrame(columns, index=df.index, columns=df.columns, copy=False)
+        for consumer_type, columns in transformed.items()
+    }
 
 
 def print_classification_report(
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the bounded caches behind ML classification.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from privacy_aware_transform._lru import LRUCache
+from privacy_aware_transform.classifier import SensitivityClassifier
+from privacy_aware_transform.metadata import ColumnMetadata
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None
+    cache["a"]
+    cache["d"] = 4
+    assert list(cache) == ["a", "d"]
+
+
+def test_lru_cache_pickles_with_its_bound():
+    cache = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored == cache and restored.maxsize == 2
+    restored["c"] = 3
+    assert list(restored) == ["b", "c"]
+
+
+def test_ml_batch_larger_than_cache_is_fully_predicted():
+    classifier = SensitivityClassifier(use_ml=False)
+    classifier.train_ml_model([
+        ("first_name customer first name", "PII"),
+        ("email customer email address", "PII"),
+        ("diagnosis patient diagnosis code", "PHI"),
+        ("order_total total order amount", "Sensitive"),
+        ("status order status", "Non-Sensitive"),
+    ])
+    classifier._ml_cache = LRUCache(4)
+    columns = [
+        ColumnMetadata(name=f"col_{i}", data_type="string", description=f"field number {i}")
+        for i in range(20)
+    ]
+
+    results = classifier._classify_by_ml_batch(columns)
+    assert [r.reasoning for r in results if r.confidence == 0.0] == []
+    assert len(classifier._ml_cache) == 4
+    again = classifier._classify_by_ml_batch(columns)
+    assert [(r.sensitivity_class, r.confidence) for r in again] == \
+        [(r.sensitivity_class, r.confidence) for r in results]
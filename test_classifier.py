@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Regression tests for sensitivity classification.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from privacy_aware_transform.classifier import SensitivityClassifier
+from privacy_aware_transform.metadata import ColumnMetadata
+from reference_checks import assert_matches_reference, random_metadata_texts
+
+
+def _reference_rules(column: ColumnMetadata):
+    """Pattern-by-pattern classification, as the rules were first written."""
+    combined_text = f"{column.name} {column.description}".lower()
+    passes = (
+        (SensitivityClassifier.PII_PATTERNS, 'PII', 0.9, 'PII'),
+        (SensitivityClassifier.PHI_PATTERNS, 'PHI', 0.9, 'PHI'),
+        (SensitivityClassifier.SENSITIVE_PATTERNS, 'Sensitive', 0.85, 'sensitive'),
+    )
+    for patterns, sensitivity_class, confidence, label in passes:
+        for pattern, reason in patterns.items():
+            if re.search(pattern, combined_text):
+                return sensitivity_class, confidence, f"Matched {label} pattern: {reason}"
+    return 'Non-Sensitive', 0.7, "No sensitivity patterns matched; column is non-sensitive"
+
+
+def _classify(column: ColumnMetadata):
+    result = SensitivityClassifier(use_ml=False).classify_column(column)
+    return result.sensitivity_class, result.confidence, result.reasoning
+
+
+def test_reason_follows_pattern_priority():
+    column = ColumnMetadata(name="contact", data_type="string", description="contact name")
+    assert _classify(column)[2] == "Matched PII pattern: name patterns"
+
+
+def test_rules_match_reference_on_random_columns():
+    words = [
+        "contact", "name", "email", "phone", "patient", "record", "amount",
+        "zip_code", "status", "id", "key", "address", "ip_address", "dob",
+        "drug", "salary", "created", "lab_test", "Token", "Street",
+    ]
+    columns = [
+        ColumnMetadata(name=name, data_type="string", description=description)
+        for name, description in random_metadata_texts(words)
+    ]
+    assert_matches_reference(_classify, _reference_rules, columns)
+
+
+def test_declared_sensitivity_accepts_policy_spellings():
+    classifier = SensitivityClassifier(use_ml=False)
+    for declared, expected in [
+        ("pii", "PII"), ("PHI", "PHI"), ("sensitive", "Sensitive"),
+        ("Non_Sensitive", "Non-Sensitive"), ("NON-SENSITIVE", "Non-Sensitive"),
+    ]:
+        column = ColumnMetadata(name="col", data_type="string", sensitivity=declared)
+        result = classifier.classify_column(column)
+        assert (result.sensitivity_class, result.method) == (expected, "metadata")
+
+
+def test_invalid_declared_sensitivity_falls_back_to_rules(capsys):
+    column = ColumnMetadata(name="email", data_type="string", sensitivity="top-secret")
+    result = SensitivityClassifier(use_ml=False).classify_column(column)
+
+    assert (result.sensitivity_class, result.method) == ("PII", "rule-based")
+    assert "email" in capsys.readouterr().out
+
+
+def test_invalid_declared_sensitivity_does_not_abort_table():
+    columns = [
+        ColumnMetadata(name="customer_id", data_type="integer", sensitivity="Non-Sensitive"),
+        ColumnMetadata(name="email", data_type="string", sensitivity="top-secret"),
+        ColumnMetadata(name="diagnosis", data_type="string", description="patient diagnosis"),
+    ]
+    results = SensitivityClassifier(use_ml=False).classify_table(columns)
+
+    assert {name: r.sensitivity_class for name, r in results.items()} == {
+        "customer_id": "Non-Sensitive", "email": "PII", "diagnosis": "PHI",
+    }
+    assert results["customer_id"].method == "metadata"
+    assert results["email"].method != "metadata"
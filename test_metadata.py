@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Regression tests for metadata loading and the YAML parse cache.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from privacy_aware_transform.metadata import MetadataLoader
+
+
+def _table_yaml(table_name: str) -> str:
+    return (
+        f"table_name: {table_name}\n"
+        "columns:\n"
+        f"  - name: {table_name}_id\n"
+        "    data_type: integer\n"
+    )
+
+
+def test_empty_file_does_not_shift_tables_between_files(tmp_path):
+    (tmp_path / "t1.yaml").write_text("")
+    (tmp_path / "t2.yaml").write_text(_table_yaml("t2"))
+    (tmp_path / "t3.yaml").write_text(_table_yaml("t3"))
+    (tmp_path / "t4.yaml").write_text("# header\n---\n" + _table_yaml("t4"))
+
+    loader = MetadataLoader(str(tmp_path))
+    tables = loader.load_all_tables()
+
+    assert sorted(tables) == ["t2", "t3", "t4"]
+    for name in ["t2", "t3", "t4"]:
+        assert loader.load_table_metadata(f"{name}.yaml").table_name == name
+    # The empty file holds no table; it must not be cached as its neighbour's
+    with pytest.raises(Exception):
+        loader.load_table_metadata("t1.yaml")
+
+
+def test_load_all_tables_keeps_files_and_tables_aligned(tmp_path):
+    (tmp_path / "t0.yaml").write_text("")
+    (tmp_path / "t1.yaml").write_text("# comments only\n")
+    (tmp_path / "t2.yaml").write_text(_table_yaml("t2"))
+    (tmp_path / "t3.yaml").write_text("---\n" + _table_yaml("t3"))
+    (tmp_path / "t4.yaml").write_text("# header\n---\n" + _table_yaml("t4"))
+
+    loader = MetadataLoader(str(tmp_path))
+    tables = loader.load_all_tables()
+
+    assert sorted(tables) == ["t2", "t3", "t4"]
+    for name, table in tables.items():
+        assert [col.name for col in table.columns] == [f"{name}_id"]
+
+    # Served from the parse cache, which must hold each file's own table
+    for name in ["t2", "t3", "t4"]:
+        assert loader.load_table_metadata(f"{name}.yaml").table_name == name
+    for name in ["t0", "t1"]:
+        with pytest.raises(Exception):
+            loader.load_table_metadata(f"{name}.yaml")
+
+
+def test_edited_file_is_reparsed(tmp_path):
+    path = tmp_path / "t.yaml"
+    path.write_text(_table_yaml("before"))
+    loader = MetadataLoader(str(tmp_path))
+    assert loader.load_table_metadata("t.yaml").table_name == "before"
+
+    path.write_text(_table_yaml("after_edit"))
+    assert loader.load_table_metadata("t.yaml").table_name == "after_edit"
+
+
+def test_unchanged_files_are_served_from_parse_cache(tmp_path):
+    for name in ["a", "b"]:
+        (tmp_path / f"{name}.yaml").write_text(_table_yaml(name))
+    loader = MetadataLoader(str(tmp_path))
+    first = loader.load_all_tables()
+
+    hits = MetadataLoader.parse_cache_info().hits
+    second = MetadataLoader(str(tmp_path)).load_all_tables()
+    assert MetadataLoader.parse_cache_info().hits == hits + 2
+    assert sorted(second) == sorted(first) == ["a", "b"]
+    assert [c.name for c in second["a"].columns] == ["a_id"]
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Regression tests for MLClassifierTrainer persistence and incremental training,
+and for the FastLinearPredictor that scores its models.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.pipeline import Pipeline
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from privacy_aware_transform.classifier import SensitivityClassifier
+from privacy_aware_transform.ml_classifier import FastLinearPredictor, MLClassifierTrainer
+
+
+TEXTS = [
+    "first_name customer first name string",
+    "email customer email address string",
+    "order_total total order amount decimal",
+    "status order status string",
+]
+LABELS = ["PII", "PII", "Sensitive", "Non-Sensitive"]
+
+
+def _trained_model_path(tmp_path):
+    trainer = MLClassifierTrainer()
+    trainer.train(TEXTS * 3, LABELS * 3)
+    path = tmp_path / "model.pkl"
+    trainer.save_model(str(path))
+    return path
+
+
+def test_load_then_partial_train(tmp_path):
+    path = _trained_model_path(tmp_path)
+
+    trainer = MLClassifierTrainer()
+    trainer.model = MLClassifierTrainer.load_model(str(path))
+    trainer.partial_train(["phone_number customer phone string"], ["PII"])
+
+    assert trainer.predict("phone_number customer phone string")[0] in LABELS
+
+
+def test_partial_train_on_memory_mapped_model(tmp_path):
+    path = _trained_model_path(tmp_path)
+
+    trainer = MLClassifierTrainer()
+    trainer.model = MLClassifierTrainer.load_model(str(path), mmap_mode='r')
+    trainer.partial_train(["phone_number customer phone string"], ["PII"])
+
+    assert trainer.model.named_steps['classifier'].coef_.flags.writeable
+
+
+def test_partial_train_updates_predictions():
+    trainer = MLClassifierTrainer()
+    trainer.partial_train(TEXTS, LABELS, classes=["PII", "PHI", "Sensitive", "Non-Sensitive"])
+    before = trainer.model.predict_proba(TEXTS)
+
+    trainer.partial_train(["diagnosis patient diagnosis code string"] * 5, ["PHI"] * 5)
+    after = trainer.model.predict_proba(TEXTS)
+
+    assert (before != after).any()
+    assert trainer.predict("diagnosis patient diagnosis code string")[0] == "PHI"
+
+
+def test_partial_train_rejects_tfidf_model():
+    # The layout models were saved with before feature hashing
+    trainer = MLClassifierTrainer()
+    trainer.model = Pipeline([
+        ('tfidf', TfidfVectorizer(max_features=100, ngram_range=(1, 2), max_df=0.9)),
+        ('classifier', LogisticRegression(max_iter=200, class_weight='balanced')),
+    ]).fit(TEXTS * 3, LABELS * 3)
+
+    with pytest.raises(ValueError, match="hashed model"):
+        trainer.partial_train(["phone_number customer phone string"], ["PII"])
+
+
+UNSEEN_TEXTS = TEXTS + [
+    "", "zzz unseen tokens only", "first_name email order_total status",
+    "EMAIL Address", "diagnosis patient diagnosis code string",
+]
+
+
+def _assert_predictor_matches(pipeline):
+    predictor = FastLinearPredictor(pipeline)
+    assert list(predictor.classes_) == list(pipeline.classes_)
+    np.testing.assert_allclose(
+        predictor.predict_proba(UNSEEN_TEXTS), pipeline.predict_proba(UNSEEN_TEXTS),
+        rtol=1e-6, atol=1e-9
+    )
+    return predictor
+
+
+def test_fast_predictor_matches_hashing_pipeline():
+    trainer = MLClassifierTrainer()
+    trainer.train(TEXTS * 3, LABELS * 3)
+    _assert_predictor_matches(trainer.model)
+
+
+def test_fast_predictor_matches_tfidf_pipelines():
+    for labels in [LABELS, ["PII", "PII", "Non-Sensitive", "Non-Sensitive"]]:
+        classifier = SensitivityClassifier(use_ml=False)
+        classifier.train_ml_model(list(zip(TEXTS * 3, labels * 3)))
+        _assert_predictor_matches(classifier.ml_pipeline)
+
+
+def test_fast_predictor_bounds_hashed_token_cache():
+    trainer = MLClassifierTrainer()
+    trainer.train(TEXTS * 3, LABELS * 3)
+    predictor = FastLinearPredictor(trainer.model)
+    predictor.predict_proba([f"token{i} other{i}" for i in range(3000)])
+
+    assert predictor._hashed_index.cache_info().currsize <= FastLinearPredictor.HASH_CACHE_MAXSIZE
+    np.testing.assert_allclose(
+        predictor.predict_proba(UNSEEN_TEXTS), trainer.model.predict_proba(UNSEEN_TEXTS),
+        rtol=1e-6, atol=1e-9
+    )
+
+
+def test_fast_predictor_rejects_signed_hashing():
+    pipeline = Pipeline([
+        ('hasher', HashingVectorizer(n_features=64)),
+        ('classifier', SGDClassifier(loss='log_loss', random_state=0)),
+    ]).fit(TEXTS * 3, LABELS * 3)
+    with pytest.raises(ValueError):
+        FastLinearPredictor(pipeline)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Regression tests for consumer policies and the policy engine.
+"""
+
+import copy
+import dataclasses
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from privacy_aware_transform.policy import (
+    ConsumerPolicy, ConsumerType, PolicyEngine, SensitivityLevel, TransformationRule
+)
+
+
+def _rule(sensitivity, transformation_type="hash", consumer_type=ConsumerType.PUBLIC):
+    return TransformationRule(
+        sensitivity=sensitivity,
+        consumer_type=consumer_type,
+        transformation_type=transformation_type,
+        parameters={"algorithm": "sha256"}
+    )
+
+
+def test_get_rule_sees_rules_edited_after_creation():
+    policy = ConsumerPolicy(name="Custom", consumer_type=ConsumerType.PUBLIC)
+    assert policy.get_rule(SensitivityLevel.PII) is None
+
+    rule = _rule(SensitivityLevel.PII)
+    policy.rules[SensitivityLevel.PII] = rule
+    assert policy.get_rule(SensitivityLevel.PII) is rule
+
+    del policy.rules[SensitivityLevel.PII]
+    assert policy.get_rule(SensitivityLevel.PII) is None
+
+
+def test_engine_sees_rules_edited_after_registration():
+    engine = PolicyEngine()
+    policy = ConsumerPolicy(name="Custom", consumer_type=ConsumerType.PUBLIC)
+    engine.add_custom_policy(policy)
+    assert engine.get_transformation_rule("public", "PHI") is None
+
+    rule = _rule(SensitivityLevel.PHI)
+    policy.rules[SensitivityLevel.PHI] = rule
+    assert engine.get_transformation_rule("public", "PHI") is rule
+
+
+def test_engine_sees_directly_assigned_policies():
+    engine = PolicyEngine()
+    rule = _rule(SensitivityLevel.PII, "mask", ConsumerType.REPORTING)
+    engine.policies = {
+        "reporting": ConsumerPolicy(
+            name="Reporting", consumer_type=ConsumerType.REPORTING,
+            rules={SensitivityLevel.PII: rule}
+        )
+    }
+
+    assert engine.get_transformation_rule("reporting", "PII") is rule
+    assert engine.get_transformation_rule("public", "PII") is None
+
+
+def test_default_rules_resolve_for_all_spellings():
+    engine = PolicyEngine()
+    for spelling in ["Non-Sensitive", "NON_SENSITIVE", "non-sensitive", "Non_Sensitive"]:
+        rule = engine.get_transformation_rule("internal_analyst", spelling)
+        assert rule.transformation_type == "keep"
+    assert engine.get_transformation_rule("external_partner", "pii").transformation_type == "hash"
+    assert engine.get_transformation_rule("external_partner", "unknown") is None
+
+
+def test_default_rules_round_trip():
+    engine = PolicyEngine()
+    rule = engine.get_transformation_rule("internal_analyst", "Sensitive")
+
+    restored = pickle.loads(pickle.dumps(engine))
+    restored_rule = restored.get_transformation_rule("internal_analyst", "Sensitive")
+    assert restored_rule == rule
+    assert restored_rule.parameters == rule.parameters
+
+    copied = copy.deepcopy(rule)
+    assert copied == rule and copied.parameters == rule.parameters
+
+    as_dict = dataclasses.asdict(rule)
+    assert as_dict["parameters"] == {"keep_positions": (0, -1), "mask_char": "*"}
+
+
+def test_default_rule_parameters_are_read_only():
+    rule = PolicyEngine().get_transformation_rule("external_partner", "PII")
+    with pytest.raises(TypeError):
+        rule.parameters["algorithm"] = "md5"
+    assert rule.parameters["algorithm"] == "sha256"
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Regression tests for keyword-based label inference in train_ml_classifier.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import train_ml_classifier
+from reference_checks import assert_matches_reference, random_metadata_texts
+
+
+class _Automaton:
+    """Minimal pure-Python stand-in for pyahocorasick's Automaton."""
+
+    def __init__(self):
+        self._words = {}
+
+    def __contains__(self, word):
+        return word in self._words
+
+    def add_word(self, word, value):
+        self._words[word] = value
+
+    def make_automaton(self):
+        pass
+
+    def iter(self, text):
+        # Matches in order of their end position, as pyahocorasick reports them
+        for end in range(len(text)):
+            for word, value in self._words.items():
+                if text.endswith(word, 0, end + 1):
+                    yield end, value
+
+
+def _infer(text_pair):
+    return train_ml_classifier.infer_sensitivity_class(*text_pair)
+
+
+def _reference_infer(text_pair):
+    """Keyword search in priority order, as the heuristic was first written."""
+    column_name, description = text_pair
+    combined_text = f"{column_name} {description}".lower()
+    for label, keywords in train_ml_classifier.KEYWORD_CLASSES:
+        for keyword in keywords:
+            if keyword in combined_text:
+                return label
+    return 'Non-Sensitive'
+
+
+def _random_columns(count):
+    words = [keyword for _, keywords in train_ml_classifier.KEYWORD_CLASSES for keyword in keywords]
+    words += ["status", "created_at", "id", "Customer", "code", "lab", "credit_card_type", ""]
+    return random_metadata_texts(words, count)
+
+
+def test_keyword_checks_match_reference(monkeypatch):
+    monkeypatch.setattr(train_ml_classifier, "_KEYWORD_AUTOMATON", None)
+    assert_matches_reference(_infer, _reference_infer, _random_columns(2000))
+
+
+def test_keyword_automaton_matches_reference(monkeypatch):
+    stand_in = type("ahocorasick", (), {"Automaton": _Automaton})
+    monkeypatch.setattr(train_ml_classifier, "ahocorasick", stand_in)
+    automaton = train_ml_classifier._build_keyword_automaton()
+    assert automaton is not None
+    monkeypatch.setattr(train_ml_classifier, "_KEYWORD_AUTOMATON", automaton)
+
+    assert_matches_reference(_infer, _reference_infer, _random_columns(2000))
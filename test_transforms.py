@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the column-at-a-time transformer kernels.
+
+Each transformer's transform_column must give the same results as calling
+transform() on every value.
+"""
+
+import hashlib
+import hmac
+import sys
+from functools import partial
+from types import SimpleNamespace
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import numpy as np
+import pytest
+
+from privacy_aware_transform import transforms
+from privacy_aware_transform.policy import PolicyEngine
+from privacy_aware_transform.transforms import (
+    HashingTransformer, MaskingTransformer, TokenizationTransformer, TransformationEngine
+)
+from reference_checks import assert_matches_reference, transform_each
+
+
+MIXED_VALUES = [
+    "john@example.com", "", None, "a", "ab", "abc", "x" * 200, 12345, 3.5,
+    "ends in nul\x00", "\x00", "mid\x00dle", "emoji 😀 here", "😀", "🏳️‍🌈 flag",
+    "naïve café", "tab\there", "  spaced  ",
+]
+
+
+def _assert_column_matches_values(transformer, *columns):
+    assert_matches_reference(
+        transformer.transform_column, partial(transform_each, transformer), columns
+    )
+
+
+def test_mask_column_matches_transform():
+    for keep_positions in [None, [0, -1], [0, 1, 2], [-1, -2], [5, -7], [0, 1, 2, 3, 4, 5, 6]]:
+        for mask_char in ["*", "#", "xy", "\x00"]:
+            transformer = MaskingTransformer(keep_positions=keep_positions, mask_char=mask_char)
+            _assert_column_matches_values(transformer, MIXED_VALUES)
+
+
+def test_mask_column_matches_transform_across_chunks():
+    transformer = MaskingTransformer(keep_positions=[0, -1])
+    transformer.MATRIX_CHUNK_ROWS = 4
+    values = [f"value-{i}" * (i % 5) for i in range(23)] + MIXED_VALUES
+    _assert_column_matches_values(transformer, values)
+
+
+def test_hash_column_matches_transform():
+    columns = [
+        MIXED_VALUES,
+        ["active", "inactive", "", None] * 600,  # low cardinality: deduplicated
+        [f"user{i}@example.com" for i in range(3000)],
+        list(range(3000)),
+        [1.5, 2.5, None] * 1000,
+    ]
+    for algorithm in ["sha256", "md5", "SHA512", "sha3_256"]:
+        _assert_column_matches_values(HashingTransformer(algorithm), *columns)
+
+
+def test_hash_column_sends_non_string_columns_to_plain_path():
+    transformer = HashingTransformer()
+    calls = []
+    transform = transformer.transform
+    transformer.transform = lambda value: calls.append(value) or transform(value)
+
+    transformer.transform_column([1, 2, 3, 1, 2, 3] * 500)
+    assert calls == []
+
+
+def test_hash_bytes_matches_column():
+    transformer = HashingTransformer()
+    strings = [v for v in MIXED_VALUES if isinstance(v, str)]
+    encoded = [v.encode('utf-8') for v in strings] + [None]
+    assert transformer.transform_bytes(encoded) == transformer.transform_column(strings + [None])
+
+
+def test_tokens_match_hmac_sha256():
+    # Short, exactly one block, longer than a block, and bytes keys
+    for secret in ["k", "s" * 64, "long" * 40, b"\x00\xffraw"]:
+        key = secret.encode('utf-8') if isinstance(secret, str) else secret
+        transformer = TokenizationTransformer(secret_key=secret, token_length=20)
+        for value in MIXED_VALUES:
+            if value is None or value == "":
+                expected = ""
+            else:
+                digest = hmac.new(key, str(value).encode('utf-8'), hashlib.sha256).hexdigest()
+                expected = "TOKEN_" + digest[:20]
+            assert transformer.transform(value) == expected
+
+
+def test_token_column_and_bytes_match_transform():
+    transformer = TokenizationTransformer(secret_key="secret")
+    reference = partial(transform_each, TokenizationTransformer(secret_key="secret"))
+    values = MIXED_VALUES + [f"user{i}" for i in range(50)] * 2
+    # Served from the token cache the second time
+    assert_matches_reference(transformer.transform_column, reference, [values, values])
+
+    strings = [v for v in values if isinstance(v, str)]
+    assert transformer.transform_bytes([v.encode('utf-8') for v in strings]) == \
+        transformer.transform_column(strings)
+
+
+def test_token_cache_stays_bounded_and_correct():
+    transformer = TokenizationTransformer(secret_key="secret")
+    transformer.CACHE_MAXSIZE = 8
+    reference = partial(transform_each, TokenizationTransformer(secret_key="secret"))
+    values = [f"v{i % 13}" for i in range(100)]
+
+    assert_matches_reference(transformer.transform_column, reference, [values])
+    assert_matches_reference(partial(transform_each, transformer), reference, [values])
+    assert len(transformer._cache) <= 8
+
+
+def test_blake3_tokens_use_condensed_key(monkeypatch):
+    # Keyed BLAKE2s stands in for BLAKE3: both take a 32-byte key
+    monkeypatch.setattr(transforms, "blake3", SimpleNamespace(
+        blake3=lambda data, key: hashlib.blake2s(data, key=key)
+    ))
+    for secret, key in [
+        ("secret", hashlib.sha256(b"secret").digest()),
+        ("k" * 32, b"k" * 32),
+    ]:
+        transformer = TokenizationTransformer(secret_key=secret, use_blake3=True)
+        expected = ["TOKEN_" + hashlib.blake2s(b"alice", key=key).hexdigest()[:16], ""]
+        assert transformer.transform_column(["alice", None]) == expected
+        assert [transformer.transform(v) for v in ["alice", None]] == expected
+        assert transformer.transform_bytes([b"alice", b""]) == expected
+
+
+def test_blake3_requires_the_package(monkeypatch):
+    monkeypatch.setattr(transforms, "blake3", None)
+    with pytest.raises(ImportError):
+        TokenizationTransformer(secret_key="secret", use_blake3=True)
+
+
+def test_default_tokenization_secret_is_shared_per_engine(monkeypatch):
+    monkeypatch.delenv("PRIVACY_SECRET_KEY", raising=False)
+    engine = TransformationEngine()
+    short = engine.get_transformer("tokenize", {"token_length": 8})
+    long = engine.get_transformer("tokenize", {"token_length": 16})
+    assert short is not long
+    assert long.transform("alice").startswith(short.transform("alice"))
+
+    other = TransformationEngine().get_transformer("tokenize", {"token_length": 16})
+    assert other.transform("alice") != long.transform("alice")
+
+
+def test_keep_returns_a_new_list():
+    engine = TransformationEngine()
+    values = ["a", None, 3]
+    for data in [values, np.array(values, dtype=object), iter(values)]:
+        kept = engine.apply_transformation(data, "keep")
+        assert kept == values and type(kept) is list and kept is not data
+
+    kept = engine.apply_column_transformation(
+        values, "Non-Sensitive", "internal_analyst", PolicyEngine()
+    )
+
+    assert kept == values and kept is not values
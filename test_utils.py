@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the DataFrame helpers in privacy_aware_transform.utils.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from privacy_aware_transform import utils
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'customer_id': [1, 2, 3],
+        'email': ['a@example.com', 'b,c@example.com', 'say "hi"'],
+        'status': ['active', None, 'inactive'],
+    })
+
+
+def test_save_csv_data_defaults_to_pandas_output(tmp_path):
+    df = _frame()
+    path = tmp_path / "out.csv"
+    utils.save_csv_data(df, str(path))
+    assert path.read_text() == df.to_csv(index=False)
+
+
+def test_save_csv_data_falls_back_when_arrow_cannot_write(tmp_path, monkeypatch):
+    class ArrowNotImplementedError(Exception):
+        pass
+
+    def write_csv(table, filepath, write_options=None):
+        Path(filepath).write_text("partial")
+        raise ArrowNotImplementedError("unsupported column type")
+
+    monkeypatch.setattr(utils, "pa", SimpleNamespace(
+        ArrowInvalid=ValueError,
+        ArrowTypeError=TypeError,
+        ArrowNotImplementedError=ArrowNotImplementedError,
+        Table=SimpleNamespace(from_pandas=lambda df, preserve_index: object()),
+    ))
+    monkeypatch.setattr(utils, "pa_csv", SimpleNamespace(
+        write_csv=write_csv,
+        WriteOptions=lambda **kwargs: None,
+    ), raising=False)
+
+    df = _frame()
+    path = tmp_path / "out.csv"
+    utils.save_csv_data(df, str(path), use_pyarrow=True)
+    assert path.read_text() == df.to_csv(index=False)
+
+
+def test_save_csv_data_pyarrow_matches_pandas(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = _frame()
+    df['amount'] = [1.5, None, 3.0]
+    df['active'] = [True, False, True]
+    arrow_path = tmp_path / "arrow.csv"
+    pandas_path = tmp_path / "pandas.csv"
+
+    utils.save_csv_data(df, str(arrow_path), use_pyarrow=True)
+    utils.save_csv_data(df, str(pandas_path))
+    # Quoting and literal spellings differ; the data read back must not
+    pd.testing.assert_frame_equal(pd.read_csv(arrow_path), pd.read_csv(pandas_path))
+
+
+def test_save_csv_data_pyarrow_falls_back_on_nested_columns(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({'tags': [[1, 2], [3]], 'name': ['x', 'y']})
+    path = tmp_path / "out.csv"
+    utils.save_csv_data(df, str(path), use_pyarrow=True)
+    assert path.read_text() == df.to_csv(index=False)
@@ -5,7 +5,7 @@ Training Script for ML-Based Sensitivity Classifier
 This script:
 1. Scans table_structure/metadata/ from all YAML files
 2. Extracts training data from column metadata
-3. Trains a Logistic Regression model with TF-IDF features
+3. Trains a Logistic Regression model on hashed n-gram features
 4. Saves the trained model to models/sensitivity_classifier.pkl
 
 Usage:
@@ -20,13 +20,71 @@ To add more training data:
 
 import sys
 from pathlib import Path
+import numpy as np
 import yaml
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from privacy_aware_transform.ml_classifier import MLClassifierTrainer
 from privacy_aware_transform.metadata import MetadataLoader
+from privacy_aware_transform.policy import parse_sensitivity_level
+
+
+# Keywords per sensitivity class, in priority order
+PII_KEYWORDS = ('first_name', 'last_name', 'name', 'email', 'phone', 'ssn',
+                'social_security', 'passport', 'driver_license', 'address',
+                'dob', 'date_of_birth', 'credit_card')
+PHI_KEYWORDS = ('diagnosis', 'medication', 'patient', 'health', 'medical_record',
+                'medical', 'clinical', 'laboratory', 'lab_result', 'procedure',
+                'surgery', 'treatment')
+SENSITIVE_KEYWORDS = ('salary', 'income', 'amount', 'price', 'cost', 'revenue',
+                      'bank', 'account', 'balance', 'transaction', 'zip_code',
+                      'location', 'latitude', 'longitude', 'ip_address', 'device_id',
+                      'password', 'token', 'credit', 'financial')
+KEYWORD_CLASSES = (('PII', PII_KEYWORDS), ('PHI', PHI_KEYWORDS), ('Sensitive', SENSITIVE_KEYWORDS))
+
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over all keywords, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for rank, (label, keywords) in enumerate(KEYWORD_CLASSES):
+        for keyword in keywords:
+            # A keyword listed under several classes keeps the highest-priority one
+            if keyword not in automaton:
+                automaton.add_word(keyword, (rank, label))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_checks():
+    """
+    Flatten the keyword classes into ordered (keyword, label) pairs.
+
+    A keyword containing another keyword of the same or a higher-priority
+    class can never decide the label, so it is dropped.
+    """
+    checks = []
+    pool = ()
+    for label, keywords in KEYWORD_CLASSES:
+        pool += keywords
+        checks.extend(
+            (keyword, label) for keyword in keywords
+            if not any(other != keyword and other in keyword for other in pool)
+        )
+    return tuple(checks)
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+_KEYWORD_CHECKS = _build_keyword_checks()
 
 
 def infer_sensitivity_class(column_name: str, description: str) -> str:
@@ -36,6 +94,9 @@ def infer_sensitivity_class(column_name: str, description: str) -> str:
     Uses heuristics based on column name and description.
     These labels are used to train the ML model.
 
+    With pyahocorasick installed, all keywords are found in a single pass
+    over the text; otherwise the keywords are searched for in priority order.
+
     Args:
         column_name: Column name
         description: Column description
@@ -45,30 +106,19 @@ def infer_sensitivity_class(column_name: str, description: str) -> str:
     """
     combined_text = f"{column_name} {description}".lower()
 
-    # PII indicators
-    pii_keywords = ['first_name', 'last_name', 'name', 'email', 'phone', 'ssn', 
-                    'social_security', 'passport', 'driver_license', 'address', 
-                    'dob', 'date_of_birth', 'credit_card']
-    for keyword in pii_keywords:
+    if _KEYWORD_AUTOMATON is not None:
+        # The highest-priority class among all matches wins
+        best = None
+        for _, (rank, label) in _KEYWORD_AUTOMATON.iter(combined_text):
+            if best is None or rank < best[0]:
+                best = (rank, label)
+                if rank == 0:
+                    break
+        return best[1] if best is not None else 'Non-Sensitive'
+
+    for keyword, label in _KEYWORD_CHECKS:
         if keyword in combined_text:
-            return 'PII'
-
-    # PHI indicators
-    phi_keywords = ['diagnosis', 'medication', 'patient', 'health', 'medical_record',
-                    'medical', 'clinical', 'laboratory', 'lab_result', 'procedure',
-                    'surgery', 'treatment']
-    for keyword in phi_keywords:
-        if keyword in combined_text:
-            return 'PHI'
-
-    # Sensitive indicators
-    sensitive_keywords = ['salary', 'income', 'amount', 'price', 'cost', 'revenue',
-                         'bank', 'account', 'balance', 'transaction', 'zip_code',
-                         'location', 'latitude', 'longitude', 'ip_address', 'device_id',
-                         'password', 'token', 'credit', 'financial']
-    for keyword in sensitive_keywords:
-        if keyword in combined_text:
-            return 'Sensitive'
+            return label
 
     # Default
     return 'Non-Sensitive'
@@ -108,8 +158,19 @@ def extract_training_data_from_metadata(metadata_dir: str) -> list:
     for table_name, table_meta in all_tables.items():
         print(f"\n  Processing table: {table_name}")
         for column in table_meta.columns:
-            # Infer label from metadata
-            label = infer_sensitivity_class(column.name, column.description)
+            # Use the declared sensitivity if present, else infer it from metadata
+            label = None
+            if column.sensitivity:
+                level = parse_sensitivity_level(column.sensitivity)
+                if level is not None:
+                    label = level.value
+                else:
+                    print(f"    Warning: invalid declared sensitivity for "
+                          f"{table_name}.{column.name}: {column.sensitivity!r}; "
+                          f"inferring it instead")
+
+            if label is None:
+                label = infer_sensitivity_class(column.name, column.description)
 
             # Create training sample
             training_sample = {
@@ -138,10 +199,15 @@ def main():
         print("\nError: No training data extracted. Check metadata files.")
         sys.exit(1)
 
+    # Split the samples once; both lists are reused for training and evaluation
+    feature_texts = [item['features'] for item in training_data]
+    labels = [item['label'] for item in training_data]
+    labels_arr = np.array(labels)
+
     print(f"\nExtracted {len(training_data)} training samples\n")
     print("Distribution:")
-    from collections import Counter
-    label_counts = Counter(item['label'] for item in training_data)
+    unique_labels, counts = np.unique(labels_arr, return_counts=True)
+    label_counts = dict(zip(unique_labels.tolist(), counts.tolist()))
     for label in ['PII', 'PHI', 'Sensitive', 'Non-Sensitive']:
         count = label_counts.get(label, 0)
         if count > 0:
@@ -149,8 +215,6 @@ def main():
             print(f"  {label:20} {count:3d} samples ({percentage:5.1f}%)")
 
     trainer = MLClassifierTrainer()
-    feature_texts = [item['features'] for item in training_data]
-    labels = [item['label'] for item in training_data]
 
     print("\nTraining model...\n")
 
@@ -170,14 +234,15 @@ def main():
 
     # Predict on training data to show performance
     predictions = trainer.predict_batch(feature_texts)
-    correct = sum(1 for (pred, _), true_label in zip(predictions, labels) if pred == true_label)
+    predicted = np.array([pred for pred, _ in predictions])
+    correct = int(np.count_nonzero(predicted == labels_arr))
     accuracy = (correct / len(labels)) * 100
 
     print(f"Training accuracy: {accuracy:.1f}% ({correct}/{len(labels)} correct)")
 
     # Show sample predictions
     print("\nSample predictions:")
-    for i, (training_item, (pred, conf)) in enumerate(list(zip(training_data, predictions))[:5], 1):
+    for i, (training_item, (pred, conf)) in enumerate(zip(training_data[:5], predictions), 1):
         true_label = training_item['label']
         match = "✓" if pred == true_label else "✗"
         print(f"  {i}. {training_item['column_name']:30} | True: {true_label:15} | Pred: {pred:15} | Conf: {conf:.2f} {match}")